@@ -0,0 +1,63 @@
+"""
+Shared pytest fixtures for the ETL test suite.
+
+Sample frames are built once per session; tests that modify their input
+should request the function-scoped ``*_copy`` variants instead.
+"""
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sample_input_data():
+    """Fixture providing raw EIA-style generator rows."""
+    return pd.DataFrame({
+        'plantName': ['Houston Solar Farm', 'Dallas Gas Plant', 'Austin Wind Farm'],
+        'technology': ['Solar Photovoltaic', 'Natural Gas Combined Cycle', 'Onshore Wind Turbine'],
+        'nameplate-capacity-mw': [100.0, 500.0, 200.0]
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_geocoded_data():
+    """Fixture providing geocoded, fuel-normalized generator rows."""
+    return pd.DataFrame({
+        'plantName': ['Plant A', 'Plant A', 'Plant B'],
+        'lat': [30.0, 30.0, 32.0],
+        'lon': [-97.0, -97.0, -96.0],
+        'fuel': ['GAS', 'GAS', 'SOLAR'],
+        'nameplate-capacity-mw': [100.0, 200.0, 50.0],
+        'base_location': ['Austin', 'Austin', 'Dallas']
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_output_data():
+    """Fixture providing a valid canonical generation row."""
+    return pd.DataFrame({
+        'plant_name': ['Test Plant A'],
+        'lat': [30.0],
+        'lon': [-97.0],
+        'capacity_mw': [100.0],
+        'fuel': ['SOLAR'],
+        'last_updated': ['2025-01-01T00:00:00Z']
+    })
+
+
+@pytest.fixture
+def sample_input_data_copy(sample_input_data):
+    """Fixture providing a private copy of the raw sample for mutation."""
+    return sample_input_data.copy()
+
+
+@pytest.fixture
+def sample_geocoded_data_copy(sample_geocoded_data):
+    """Fixture providing a private copy of the geocoded sample for mutation."""
+    return sample_geocoded_data.copy()
+
+
+@pytest.fixture
+def sample_output_data_copy(sample_output_data):
+    """Fixture providing a private copy of the output sample for mutation."""
+    return sample_output_data.copy()
@@ -19,12 +19,11 @@ Author: TAB Energy Dashboard
 Date: 2025-11-10
 """
 
-import shapefile
 import json
 from pathlib import Path
 import logging
 import sys
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Setup logging
 logging.basicConfig(
@@ -41,6 +40,30 @@ FORMATION_COLORS = {
     'Discovery': [27, 54, 93, 64]      # TAB Navy, 25% opacity
 }
 
+# Candidate shapefile locations (without extension), checked in order
+# User should place shapefile in Downloads folder or update this list
+SHAPEFILE_PATHS = [
+    Path.home() / "Downloads" / "Texas Lithium Shapefile" / "mrds-trim",
+    Path.home() / "Downloads" / "mrds-trim",
+    Path(__file__).parent.parent / "data" / "mrds-trim",
+]
+
+
+def find_shapefile() -> Optional[Path]:
+    """
+    Locate the USGS MRDS shapefile among SHAPEFILE_PATHS.
+    
+    Only stats the candidate paths, so callers can check for the input
+    without paying for the shapefile reader import.
+    
+    Returns:
+        Path to the shapefile (without extension), or None if not found
+    """
+    for path in SHAPEFILE_PATHS:
+        if path.with_suffix('.shp').exists():
+            return path
+    return None
+
 
 def determine_status(properties: Dict) -> str:
     """
@@ -153,6 +176,8 @@ def convert_usgs_shapefile_to_geojson(shapefile_path: str, simplify: bool = True
     
     logger.info(f"Reading shapefile: {shp_file}")
     
+    import shapefile  # pyshp; only needed once there is a file to read
+    
     try:
         sf = shapefile.Reader(str(shp_file))
     except Exception as e:
@@ -287,19 +312,7 @@ def main():
     logger.info("USGS MRDS Shapefile Converter - Starting")
     logger.info("=" * 60)
     
-    # Path to downloaded shapefile
-    # User should place shapefile in Downloads folder or update this path
-    shapefile_paths = [
-        Path.home() / "Downloads" / "Texas Lithium Shapefile" / "mrds-trim",
-        Path.home() / "Downloads" / "mrds-trim",
-        Path(__file__).parent.parent / "data" / "mrds-trim",
-    ]
-    
-    shapefile_path = None
-    for path in shapefile_paths:
-        if path.with_suffix('.shp').exists():
-            shapefile_path = path
-            break
+    shapefile_path = find_shapefile()
     
     if not shapefile_path:
         logger.error("❌ Shapefile not found!")
@@ -15,6 +15,7 @@ This script:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -27,6 +28,8 @@ ENDPOINT = "electricity/rto/fuel-type-data"
 RESPONDENT = "ERCO"  # ERCOT
 FREQUENCY = "hourly"
 DATA_DIR = Path(__file__).parent.parent / "data"
+PAGE_LENGTH = 5000  # Max rows per request
+MAX_CONCURRENT_PAGES = 4  # Parallel page requests after the first
 
 
 def get_api_key():
@@ -59,12 +62,33 @@ def get_api_key():
     return api_key
 
 
+def fetch_eia_page(session: requests.Session, url: str, params: dict, offset: int) -> dict:
+    """
+    Fetch a single page of EIA API results.
+    
+    Args:
+        session: HTTP session to reuse connections
+        url: EIA data endpoint URL
+        params: Query parameters without offset/length
+        offset: Row offset of the page
+        
+    Returns:
+        The 'response' object of the EIA payload (empty dict if missing)
+    """
+    print(f"  Fetching offset {offset}...")
+    response = session.get(url, params={**params, 'offset': offset, 'length': PAGE_LENGTH})
+    response.raise_for_status()
+    
+    return response.json().get('response', {})
+
+
 def fetch_eia_data(api_key: str, start_date: str, end_date: str) -> pd.DataFrame:
     """
     Fetch fuel type data from EIA API with pagination.
     
     The EIA API returns data in pages (default 5000 rows per page).
-    This function handles pagination to retrieve all available data.
+    The first page reports the total row count; the remaining pages are
+    then fetched concurrently and reassembled in offset order.
     
     Args:
         api_key: EIA API key
@@ -74,55 +98,42 @@ def fetch_eia_data(api_key: str, start_date: str, end_date: str) -> pd.DataFrame
     Returns:
         DataFrame with raw API response data
     """
-    all_data = []
-    offset = 0
-    length = 5000  # Max rows per request
-    
     print(f"Fetching EIA fuel mix data from {start_date} to {end_date}...")
     
-    while True:
-        # Build API request
-        # facets: filter criteria (respondent=ERCO for ERCOT)
-        # frequency: hourly data
-        # data: value is the generation in MWh
-        # start/end: date range filter
-        # sort: order by period (timestamp) ascending
-        url = f"{API_BASE_URL}/{ENDPOINT}/data/"
-        params = {
-            'api_key': api_key,
-            'frequency': FREQUENCY,
-            'data[0]': 'value',
-            'facets[respondent][]': RESPONDENT,
-            'start': start_date,
-            'end': end_date,
-            'sort[0][column]': 'period',
-            'sort[0][direction]': 'asc',
-            'offset': offset,
-            'length': length,
-        }
-        
-        print(f"  Fetching offset {offset}...")
-        response = requests.get(url, params=params)
-        response.raise_for_status()
+    # Build API request
+    # facets: filter criteria (respondent=ERCO for ERCOT)
+    # frequency: hourly data
+    # data: value is the generation in MWh
+    # start/end: date range filter
+    # sort: order by period (timestamp) ascending
+    url = f"{API_BASE_URL}/{ENDPOINT}/data/"
+    params = {
+        'api_key': api_key,
+        'frequency': FREQUENCY,
+        'data[0]': 'value',
+        'facets[respondent][]': RESPONDENT,
+        'start': start_date,
+        'end': end_date,
+        'sort[0][column]': 'period',
+        'sort[0][direction]': 'asc',
+    }
+    
+    with requests.Session() as session:
+        first_page = fetch_eia_page(session, url, params, 0)
+        all_data = list(first_page.get('data') or [])
         
-        result = response.json()
+        # Check if there's more data
+        total = int(first_page.get('total', 0) or 0)  # Convert string to int
+        offsets = range(PAGE_LENGTH, total, PAGE_LENGTH) if all_data else range(0)
         
-        # Extract data from response
-        if 'response' in result and 'data' in result['response']:
-            data = result['response']['data']
-            if not data:
-                break  # No more data
-            
-            all_data.extend(data)
-            
-            # Check if there's more data
-            total = int(result['response'].get('total', 0))  # Convert string to int
-            if offset + length >= total:
-                break
-            
-            offset += length
-        else:
-            break
+        if offsets:
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as executor:
+                pages = executor.map(
+                    lambda offset: fetch_eia_page(session, url, params, offset),
+                    offsets
+                )
+                for page in pages:
+                    all_data.extend(page.get('data') or [])
     
     print(f"  Retrieved {len(all_data)} records")
     
@@ -8,20 +8,39 @@ Data source: U.S. Energy Information Administration (EIA) Operating Generator Ca
 Output: Parquet file with standardized Texas power plant data
 """
 
+import gzip
+import hashlib
+import json
 import logging
 import os
 import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
-import time
+from types import MappingProxyType
+from typing import Dict, Final, List, Mapping, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson  # Optional: faster JSON parsing of large API pages
+except ImportError:
+    orjson = None
+
+# Shared Texas geography helpers live next to this script
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from texas_counties import validate_coordinates_vec
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -33,9 +52,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Copy-on-Write makes assign()/column selection share the input's buffers
+# until a column is actually modified, instead of copying eagerly
+pd.set_option('mode.copy_on_write', True)
+
 # Type aliases
 CoordinateTuple = Tuple[float, float, str]
-FuelMappingDict = Dict[str, str]
+FuelMappingDict = Mapping[str, str]
 LocationData = Dict[str, Union[float, str, List[str]]]
 
 # Constants
@@ -43,10 +66,15 @@ API_BASE_URL: str = "https://api.eia.gov/v2"
 CAPACITY_ENDPOINT: str = "electricity/operating-generator-capacity"
 GENERATION_ENDPOINT: str = "electricity/electric-power-operational-data"
 DATA_DIR: Path = Path(__file__).parent.parent / "data"
+CACHE_DIR: Path = DATA_DIR / ".cache" / "eia"
+CACHE_MAX_AGE: float = 30 * 24 * 3600  # Seconds a cached page is reused without revalidation
 MAX_RETRIES: int = 3
 BACKOFF_FACTOR: float = 0.3
 REQUEST_TIMEOUT: int = 30
-RATE_LIMIT_DELAY: float = 0.1
+RATE_LIMIT_DELAY: float = 0.1  # Pacing step once EIA signals throttling
+MAX_RATE_LIMIT_DELAY: float = 5.0
+PAGE_LENGTH: int = 5000  # Max records per EIA API request
+MAX_CONCURRENT_PAGES: int = 4
 
 # Texas geographic bounds for validation
 TEXAS_BOUNDS = {
@@ -55,11 +83,52 @@ TEXAS_BOUNDS = {
     'lon_min': -106.65,
     'lon_max': -93.51
 }
+# Fixed 16-byte key for pandas' SipHash-based geocoding hash; pinned here so
+# plant coordinates do not move if pandas changes its default key
+GEOCODE_HASH_KEY: str = '0123456789123456'
+
+_LAT_LO, _LAT_HI, _LON_LO, _LON_HI = (
+    np.float64(TEXAS_BOUNDS[key]) for key in ('lat_min', 'lat_max', 'lon_min', 'lon_max')
+)
 
 # Schema validation
 REQUIRED_INPUT_COLUMNS = ['plantName', 'technology', 'nameplate-capacity-mw']
 REQUIRED_OUTPUT_COLUMNS = ['plant_name', 'lat', 'lon', 'capacity_mw', 'fuel', 'last_updated']
 
+# Raw EIA columns consumed by the geocode -> normalize -> transform stages
+PIPELINE_COLUMNS = REQUIRED_INPUT_COLUMNS + ['plantCode']
+
+# Repetitive raw string columns stored as categoricals at ingest
+CATEGORICAL_INPUT_COLUMNS = ['plantName', 'technology']
+
+# Canonical fuel names, the fixed categories of the output fuel column
+FUEL_CATEGORIES = [
+    'SOLAR', 'GAS', 'WIND', 'COAL', 'NUCLEAR', 'HYDRO', 'STORAGE',
+    'OIL', 'BIOMASS', 'GEOTHERMAL', 'OTHER',
+]
+
+# Low-cardinality output columns that benefit from parquet dictionary encoding
+DICTIONARY_COLUMNS = ['plant_name', 'fuel', 'base_location', 'last_updated']
+# Float columns stored with BYTE_STREAM_SPLIT so zstd sees the byte planes separately
+BYTE_STREAM_SPLIT_COLUMNS = ['lat', 'lon', 'capacity_mw', 'actual_generation_mw']
+PARQUET_ROW_GROUP_SIZE: int = 64 * 1024  # Rows per group, keeps min/max stats useful for pushdown
+
+# HTTP retry strategy and adapter are stateless, so build them once and
+# mount the same instances on every session
+_RETRY_STRATEGY = Retry(
+    total=MAX_RETRIES,
+    backoff_factor=BACKOFF_FACTOR,
+    status_forcelist=frozenset({429, 500, 502, 503, 504}),
+)
+_HTTP_ADAPTER = HTTPAdapter(
+    max_retries=_RETRY_STRATEGY,
+    pool_connections=4,
+    pool_maxsize=16,
+)
+_SESSION_HEADERS = {
+    'User-Agent': 'TAB-Energy-Dashboard/1.0 (Educational Use)'
+}
+
 
 class ETLValidationError(Exception):
     """Custom exception for ETL validation errors."""
@@ -109,22 +178,9 @@ def create_http_session() -> requests.Session:
         Configured requests session
     """
     session = requests.Session()
-    
-    # Configure retry strategy
-    retry_strategy = Retry(
-        total=MAX_RETRIES,
-        backoff_factor=BACKOFF_FACTOR,
-        status_forcelist=[429, 500, 502, 503, 504],
-    )
-    
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    
-    # Set user agent
-    session.headers.update({
-        'User-Agent': 'TAB-Energy-Dashboard/1.0 (Educational Use)'
-    })
+    session.mount("http://", _HTTP_ADAPTER)
+    session.mount("https://", _HTTP_ADAPTER)
+    session.headers.update(_SESSION_HEADERS)
     
     return session
 
@@ -146,12 +202,224 @@ def validate_api_response(response_data: Dict) -> None:
         raise EIAAPIError("Invalid API response: missing 'data' field")
 
 
-def fetch_texas_generators(api_key: str) -> pd.DataFrame:
+class EIARateLimiter:
+    """
+    Thread-safe request pacer driven by EIA rate-limit response headers.
+    
+    Requests go out back-to-back until the API pushes back: a 429/503 or a
+    nearly exhausted X-RateLimit-Remaining doubles the spacing between
+    requests (honoring Retry-After), and each healthy response shrinks it
+    again by RATE_LIMIT_DELAY / 2.
+    """
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._delay = 0.0
+        self._next_request = 0.0
+    
+    @property
+    def delay(self) -> float:
+        """Current spacing between requests in seconds."""
+        return self._delay
+    
+    def wait(self) -> None:
+        """Block until the next request slot is available."""
+        with self._lock:
+            now = time.monotonic()
+            wait_for = self._next_request - now
+            self._next_request = max(now, self._next_request) + self._delay
+        
+        if wait_for > 0:
+            time.sleep(wait_for)
+    
+    def update(self, response: requests.Response) -> None:
+        """
+        Adjust pacing from a response's status and rate-limit headers.
+        
+        Args:
+            response: Response returned by the EIA API
+        """
+        headers = response.headers
+        throttled = response.status_code in (429, 503)
+        
+        try:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            limit = int(headers['X-RateLimit-Limit'])
+            throttled = throttled or remaining < 0.1 * limit
+        except (KeyError, ValueError):
+            pass
+        
+        with self._lock:
+            if throttled:
+                self._delay = min(MAX_RATE_LIMIT_DELAY, max(self._delay * 2, RATE_LIMIT_DELAY))
+                retry_after = headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    self._next_request = max(self._next_request, time.monotonic() + int(retry_after))
+            else:
+                self._delay = max(0.0, self._delay - RATE_LIMIT_DELAY / 2)
+
+
+def _page_cache_path(url: str, params: Dict) -> Path:
+    """Cache file for one EIA page, keyed on the query minus the API key."""
+    key = json.dumps([url, sorted((k, str(v)) for k, v in params.items() if k != 'api_key')])
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.json.gz"
+
+
+def _read_page_cache(cache_path: Path) -> Optional[Dict]:
+    """Load a cached page entry, or None if missing or unreadable."""
+    try:
+        with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable EIA cache entry {cache_path.name}: {e}")
+        return None
+
+
+def _write_page_cache(
+    cache_path: Path,
+    response: requests.Response,
+    page: Dict,
+    cached: Optional[Dict] = None
+) -> None:
+    """Store a page with its fetch time and validators; caching is best effort."""
+    cached = cached or {}
+    entry = {
+        'fetched_at': time.time(),
+        'etag': response.headers.get('ETag') or cached.get('etag'),
+        'last_modified': response.headers.get('Last-Modified') or cached.get('last_modified'),
+        'response': page,
+    }
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(entry, f)
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write EIA cache entry {cache_path.name}: {e}")
+
+
+def fetch_eia_page(
+    session: requests.Session,
+    url: str,
+    params: Dict,
+    offset: int,
+    limiter: Optional[EIARateLimiter] = None
+) -> Dict:
+    """
+    Fetch and validate a single page of an EIA API query.
+    
+    Pages are cached under CACHE_DIR. The queried months are closed, so a
+    page younger than CACHE_MAX_AGE is reused without any request; older
+    pages are revalidated with their ETag/Last-Modified validators and a
+    304 Not Modified reply is served from the cache.
+    
+    Args:
+        session: HTTP session to issue the request on
+        url: EIA API data URL
+        params: Query parameters, excluding offset/length
+        offset: Record offset of the page
+        limiter: Optional rate limiter shared by concurrent page requests
+        
+    Returns:
+        The validated 'response' object of the page
+        
+    Raises:
+        EIAAPIError: If the request fails or the response is invalid
+    """
+    page_params = {**params, 'offset': offset, 'length': PAGE_LENGTH}
+    logger.debug(f"Fetching {url} offset {offset}")
+    
+    cache_path = _page_cache_path(url, page_params)
+    cached = _read_page_cache(cache_path)
+    headers = {}
+    if cached is not None:
+        if time.time() - cached.get('fetched_at', 0) < CACHE_MAX_AGE:
+            logger.debug(f"Offset {offset} served from cache")
+            return cached['response']
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    
+    try:
+        if limiter is not None:
+            limiter.wait()
+        response = session.get(url, params=page_params, headers=headers, timeout=REQUEST_TIMEOUT)
+        if limiter is not None:
+            limiter.update(response)
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"Offset {offset} not modified, using cached page")
+            _write_page_cache(cache_path, response, cached['response'], cached)
+            return cached['response']
+        response.raise_for_status()
+    except requests.RequestException as e:
+        raise EIAAPIError(f"API request failed at offset {offset}: {e}")
+    
+    try:
+        result = orjson.loads(response.content) if orjson is not None else response.json()
+    except ValueError as e:
+        raise EIAAPIError(f"Invalid JSON response at offset {offset}: {e}")
+    
+    validate_api_response(result)
+    _write_page_cache(cache_path, response, result['response'])
+    
+    return result['response']
+
+
+def fetch_all_pages(session: requests.Session, url: str, params: Dict) -> List[Dict]:
+    """
+    Fetch every page of an EIA API query.
+    
+    The first page is fetched alone to learn the reported total; the
+    remaining offsets are then fetched concurrently on a bounded pool,
+    paced by a shared EIARateLimiter.
+    
+    Args:
+        session: HTTP session to issue the requests on
+        url: EIA API data URL
+        params: Query parameters, excluding offset/length
+        
+    Returns:
+        All data records in offset order
+        
+    Raises:
+        EIAAPIError: If any page request fails
+    """
+    limiter = EIARateLimiter()
+    first_page = fetch_eia_page(session, url, params, 0, limiter)
+    records: List[Dict] = list(first_page['data'])
+    
+    # A short first page means there is nothing else to fetch
+    total = int(first_page.get('total', 0) or 0)
+    if len(first_page['data']) < PAGE_LENGTH or total <= PAGE_LENGTH:
+        return records
+    
+    offsets = range(PAGE_LENGTH, total, PAGE_LENGTH)
+    logger.info(f"Fetching {len(offsets)} more pages ({total} records total)")
+    
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as executor:
+        pages = executor.map(
+            lambda offset: fetch_eia_page(session, url, params, offset, limiter), offsets
+        )
+        for page in pages:
+            records.extend(page['data'])
+    
+    return records
+
+
+def fetch_texas_generators(api_key: str, session: Optional[requests.Session] = None) -> pd.DataFrame:
     """
     Fetch Texas power generator data from EIA API with robust error handling.
     
     Args:
         api_key: EIA API key
+        session: Optional shared HTTP session; a private one is created
+            and closed if omitted
         
     Returns:
         DataFrame with Texas generator data
@@ -160,63 +428,28 @@ def fetch_texas_generators(api_key: str) -> pd.DataFrame:
         EIAAPIError: If API request fails
         ETLValidationError: If no data returned
     """
-    all_data: List[Dict] = []
-    offset = 0
-    length = 5000  # Max per request
-    
     logger.info("Fetching Texas power plant data from EIA API")
     
-    session = create_http_session()
+    # Build API request for Texas generators
+    url = f"{API_BASE_URL}/{CAPACITY_ENDPOINT}/data/"
+    params = {
+        'api_key': api_key,
+        'frequency': 'monthly',
+        'data[0]': 'nameplate-capacity-mw',
+        'facets[stateid][]': 'TX',  # Texas only
+        'start': '2024-01',  # Recent data
+        'end': '2024-01',
+    }
+    
+    owns_session = session is None
+    if owns_session:
+        session = create_http_session()
     
     try:
-        while True:
-            # Build API request for Texas generators
-            url = f"{API_BASE_URL}/{CAPACITY_ENDPOINT}/data/"
-            params = {
-                'api_key': api_key,
-                'frequency': 'monthly',
-                'data[0]': 'nameplate-capacity-mw',
-                'facets[stateid][]': 'TX',  # Texas only
-                'start': '2024-01',  # Recent data
-                'end': '2024-01',
-                'offset': offset,
-                'length': length,
-            }
-            
-            logger.debug(f"Fetching offset {offset}")
-            
-            try:
-                response = session.get(url, params=params, timeout=REQUEST_TIMEOUT)
-                response.raise_for_status()
-            except requests.RequestException as e:
-                raise EIAAPIError(f"API request failed at offset {offset}: {e}")
-            
-            try:
-                result = response.json()
-            except ValueError as e:
-                raise EIAAPIError(f"Invalid JSON response at offset {offset}: {e}")
-            
-            validate_api_response(result)
-            
-            # Extract data from response
-            data = result['response']['data']
-            if not data:
-                break  # No more data
-            
-            all_data.extend(data)
-            
-            # Check if there's more data
-            total = int(result['response'].get('total', 0))
-            if offset + length >= total:
-                break
-            
-            offset += length
-            
-            # Rate limiting - be respectful to EIA API
-            time.sleep(RATE_LIMIT_DELAY)
-            
+        all_data = fetch_all_pages(session, url, params)
     finally:
-        session.close()
+        if owns_session:
+            session.close()
     
     logger.info(f"Retrieved {len(all_data)} generator records")
     
@@ -227,10 +460,14 @@ def fetch_texas_generators(api_key: str) -> pd.DataFrame:
     df = pd.DataFrame(all_data)
     validate_input_schema(df)
     
+    # One row per generator repeats plant names and technologies many times;
+    # categoricals keep one copy of each and let groupby/lookup use int codes
+    df = df.astype({col: 'category' for col in CATEGORICAL_INPUT_COLUMNS})
+    
     return df
 
 
-def fetch_actual_generation(api_key: str) -> pd.DataFrame:
+def fetch_actual_generation(api_key: str, session: Optional[requests.Session] = None) -> pd.DataFrame:
     """
     Fetch actual generation data (not nameplate capacity) from EIA API.
     
@@ -239,6 +476,8 @@ def fetch_actual_generation(api_key: str) -> pd.DataFrame:
     
     Args:
         api_key: EIA API key
+        session: Optional shared HTTP session; a private one is created
+            and closed if omitted
         
     Returns:
         DataFrame with plant_id and actual_generation_mw columns
@@ -248,70 +487,36 @@ def fetch_actual_generation(api_key: str) -> pd.DataFrame:
     """
     logger.info("Fetching actual generation data from EIA API")
     
-    all_data: List[Dict] = []
-    offset = 0
-    length = 5000
+    # Calculate date range: last 3 months of available data
+    # Using 2024 data (most recent complete year as of Jan 2026)
+    start_date = '2024-07'  # July 2024
+    end_date = '2024-09'    # September 2024 (3 months)
+    
+    # Build API request for actual generation
+    url = f"{API_BASE_URL}/{GENERATION_ENDPOINT}/data/"
+    params = {
+        'api_key': api_key,
+        'frequency': 'monthly',
+        'data[0]': 'generation',  # Actual generation in MWh
+        'facets[location][]': 'TX',  # Texas only
+        'facets[sectorid][]': '99',  # All sectors
+        'start': start_date,
+        'end': end_date,
+    }
     
-    session = create_http_session()
+    owns_session = session is None
+    if owns_session:
+        session = create_http_session()
     
     try:
-        # Calculate date range: last 3 months of available data
-        # Using 2024 data (most recent complete year as of Jan 2026)
-        start_date = '2024-07'  # July 2024
-        end_date = '2024-09'    # September 2024 (3 months)
-        
-        while True:
-            # Build API request for actual generation
-            url = f"{API_BASE_URL}/{GENERATION_ENDPOINT}/data/"
-            params = {
-                'api_key': api_key,
-                'frequency': 'monthly',
-                'data[0]': 'generation',  # Actual generation in MWh
-                'facets[location][]': 'TX',  # Texas only
-                'facets[sectorid][]': '99',  # All sectors
-                'start': start_date,
-                'end': end_date,
-                'offset': offset,
-                'length': length,
-            }
-            
-            logger.debug(f"Fetching generation data offset {offset}")
-            
-            try:
-                response = session.get(url, params=params, timeout=REQUEST_TIMEOUT)
-                response.raise_for_status()
-            except requests.RequestException as e:
-                logger.warning(f"Generation API request failed at offset {offset}: {e}")
-                # Generation data is optional - if it fails, we'll continue with capacity only
-                break
-            
-            try:
-                result = response.json()
-            except ValueError as e:
-                logger.warning(f"Invalid JSON in generation response: {e}")
-                break
-            
-            # Validate response
-            if 'response' not in result or 'data' not in result['response']:
-                logger.warning("Invalid generation API response structure")
-                break
-            
-            data = result['response']['data']
-            if not data:
-                break  # No more data
-            
-            all_data.extend(data)
-            
-            # Check if there's more data
-            total = int(result['response'].get('total', 0))
-            if offset + length >= total:
-                break
-            
-            offset += length
-            time.sleep(RATE_LIMIT_DELAY)
-            
+        all_data = fetch_all_pages(session, url, params)
+    except EIAAPIError as e:
+        # Generation data is optional - if it fails, we'll continue with capacity only
+        logger.warning(f"Generation API request failed: {e}")
+        all_data = []
     finally:
-        session.close()
+        if owns_session:
+            session.close()
     
     logger.info(f"Retrieved {len(all_data)} generation records")
     
@@ -357,139 +562,186 @@ def validate_input_schema(df: pd.DataFrame) -> None:
     Raises:
         ETLValidationError: If schema validation fails
     """
-    missing_cols = [col for col in REQUIRED_INPUT_COLUMNS if col not in df.columns]
+    missing_cols = set(REQUIRED_INPUT_COLUMNS).difference(df.columns)
     if missing_cols:
-        raise ETLValidationError(f"Missing required columns: {missing_cols}")
-    
-    # Convert capacity to numeric (coerce errors to NaN)
-    df['nameplate-capacity-mw'] = pd.to_numeric(df['nameplate-capacity-mw'], errors='coerce')
+        raise ETLValidationError(f"Missing required columns: {sorted(missing_cols)}")
     
-    # Validate data types
+    # Column-level dtype check first; only text columns (the API returns
+    # numbers as strings) are parsed, and any unparseable value fails
     if not pd.api.types.is_numeric_dtype(df['nameplate-capacity-mw']):
-        raise ETLValidationError("nameplate-capacity-mw must be numeric")
+        try:
+            df['nameplate-capacity-mw'] = pd.to_numeric(df['nameplate-capacity-mw'], errors='raise')
+        except (ValueError, TypeError) as e:
+            raise ETLValidationError(f"nameplate-capacity-mw must be numeric: {e}") from e
     
     logger.info(f"Input schema validation passed: {len(df)} records")
 
 
-def get_texas_locations() -> List[CoordinateTuple]:
+# Real Texas geographic locations for natural facility distribution, as
+# (latitude, longitude, location_name) tuples
+TEXAS_LOCATIONS: Final[Tuple[CoordinateTuple, ...]] = (
+    # Major metropolitan areas
+    (29.7604, -95.3698, "Houston"),  # Harris County
+    (32.7767, -96.7970, "Dallas"),   # Dallas County
+    (29.4241, -98.4936, "San Antonio"),  # Bexar County
+    (30.2672, -97.7431, "Austin"),   # Travis County
+    (32.7555, -97.3308, "Fort Worth"),  # Tarrant County
+    
+    # Major cities
+    (26.2034, -98.2300, "McAllen"),  # Hidalgo County
+    (27.8006, -97.3964, "Corpus Christi"),  # Nueces County
+    (33.5779, -101.8552, "Lubbock"),  # Lubbock County
+    (32.4487, -99.7331, "Abilene"),  # Taylor County
+    
+    # East Texas
+    (32.3513, -94.7077, "Tyler"),    # Smith County
+    (32.5007, -94.7405, "Longview"), # Gregg County
+    (30.0588, -94.1266, "Beaumont"), # Jefferson County
+    
+    # Central Texas
+    (31.5488, -97.1131, "Waco"),     # McLennan County
+    (31.0800, -97.3428, "Temple"),   # Bell County
+    (30.6304, -96.3272, "College Station"), # Brazos County
+    
+    # West Texas
+    (31.9973, -102.0779, "Midland"), # Midland County
+    (31.8457, -102.3676, "Odessa"),  # Ector County
+    (35.2220, -101.8313, "Amarillo"), # Potter County
+    
+    # South Texas
+    (27.5064, -99.5075, "Laredo"),   # Webb County
+    (25.9018, -97.4975, "Brownsville"), # Cameron County
+    (28.0378, -82.4572, "Victoria"), # Victoria County
+    
+    # Additional locations for better distribution
+    (31.3069, -94.7821, "Jacksonville"), # Cherokee County
+    (30.0691, -93.7137, "Orange"),   # Orange County
+    (29.3013, -94.7977, "Port Arthur"), # Jefferson County
+    (28.8056, -96.9489, "Bay City"), # Matagorda County
+    (29.7030, -98.1245, "New Braunfels"), # Comal County
+    (30.5527, -97.6786, "Round Rock"), # Williamson County
+    (32.9668, -96.6989, "Plano"),    # Collin County
+    (29.5516, -98.5816, "Uvalde"),   # Uvalde County
+    (31.7619, -106.4850, "El Paso"), # El Paso County
+    (27.2517, -98.2897, "Alice"),    # Jim Wells County
+    
+    # Wind corridor locations
+    (32.0853, -100.4326, "Sweetwater"), # Nolan County
+    (32.2504, -100.9015, "Big Spring"), # Howard County
+    (32.7282, -100.8926, "Snyder"),  # Scurry County
+    (33.1584, -101.7068, "Post"),    # Garza County
+    
+    # Additional geographic diversity
+    (30.8665, -102.3929, "Fort Stockton"), # Pecos County
+    (29.8833, -103.5578, "Alpine"),  # Brewster County
+    (31.2504, -94.7291, "Lufkin"),   # Angelina County
+    (30.6280, -94.6533, "Liberty"), # Liberty County
+    (29.0383, -95.0177, "Angleton"), # Brazoria County
+    (28.6922, -96.1289, "Edna"),     # Jackson County
+    (32.4412, -94.0377, "Marshall"), # Harrison County
+    (33.9137, -98.4934, "Wichita Falls"), # Wichita County
+    (31.4638, -100.4370, "San Angelo"), # Tom Green County
+    (29.7012, -98.1245, "Seguin"),   # Guadalupe County
+)
+
+
+def get_texas_locations() -> Tuple[CoordinateTuple, ...]:
     """
     Get real Texas geographic locations for natural facility distribution.
     
     Returns:
-        List of (latitude, longitude, location_name) tuples
-    """
-    return [
-        # Major metropolitan areas
-        (29.7604, -95.3698, "Houston"),  # Harris County
-        (32.7767, -96.7970, "Dallas"),   # Dallas County
-        (29.4241, -98.4936, "San Antonio"),  # Bexar County
-        (30.2672, -97.7431, "Austin"),   # Travis County
-        (32.7555, -97.3308, "Fort Worth"),  # Tarrant County
-        
-        # Major cities
-        (26.2034, -98.2300, "McAllen"),  # Hidalgo County
-        (27.8006, -97.3964, "Corpus Christi"),  # Nueces County
-        (33.5779, -101.8552, "Lubbock"),  # Lubbock County
-        (32.4487, -99.7331, "Abilene"),  # Taylor County
-        
-        # East Texas
-        (32.3513, -94.7077, "Tyler"),    # Smith County
-        (32.5007, -94.7405, "Longview"), # Gregg County
-        (30.0588, -94.1266, "Beaumont"), # Jefferson County
-        
-        # Central Texas
-        (31.5488, -97.1131, "Waco"),     # McLennan County
-        (31.0800, -97.3428, "Temple"),   # Bell County
-        (30.6304, -96.3272, "College Station"), # Brazos County
-        
-        # West Texas
-        (31.9973, -102.0779, "Midland"), # Midland County
-        (31.8457, -102.3676, "Odessa"),  # Ector County
-        (35.2220, -101.8313, "Amarillo"), # Potter County
-        
-        # South Texas
-        (27.5064, -99.5075, "Laredo"),   # Webb County
-        (25.9018, -97.4975, "Brownsville"), # Cameron County
-        (28.0378, -82.4572, "Victoria"), # Victoria County
-        
-        # Additional locations for better distribution
-        (31.3069, -94.7821, "Jacksonville"), # Cherokee County
-        (30.0691, -93.7137, "Orange"),   # Orange County
-        (29.3013, -94.7977, "Port Arthur"), # Jefferson County
-        (28.8056, -96.9489, "Bay City"), # Matagorda County
-        (29.7030, -98.1245, "New Braunfels"), # Comal County
-        (30.5527, -97.6786, "Round Rock"), # Williamson County
-        (32.9668, -96.6989, "Plano"),    # Collin County
-        (29.5516, -98.5816, "Uvalde"),   # Uvalde County
-        (31.7619, -106.4850, "El Paso"), # El Paso County
-        (27.2517, -98.2897, "Alice"),    # Jim Wells County
-        
-        # Wind corridor locations
-        (32.0853, -100.4326, "Sweetwater"), # Nolan County
-        (32.2504, -100.9015, "Big Spring"), # Howard County
-        (32.7282, -100.8926, "Snyder"),  # Scurry County
-        (33.1584, -101.7068, "Post"),    # Garza County
-        
-        # Additional geographic diversity
-        (30.8665, -102.3929, "Fort Stockton"), # Pecos County
-        (29.8833, -103.5578, "Alpine"),  # Brewster County
-        (31.2504, -94.7291, "Lufkin"),   # Angelina County
-        (30.6280, -94.6533, "Liberty"), # Liberty County
-        (29.0383, -95.0177, "Angleton"), # Brazoria County
-        (28.6922, -96.1289, "Edna"),     # Jackson County
-        (32.4412, -94.0377, "Marshall"), # Harrison County
-        (33.9137, -98.4934, "Wichita Falls"), # Wichita County
-        (31.4638, -100.4370, "San Angelo"), # Tom Green County
-        (29.7012, -98.1245, "Seguin"),   # Guadalupe County
-    ]
+        The shared, immutable tuple of (latitude, longitude, location_name)
+        tuples; no copy is made
+    """
+    return TEXAS_LOCATIONS
+
+
+# Location table split into parallel arrays, built once so geocoding is a
+# single gather by location index
+_LOCATION_LATS = np.array([loc[0] for loc in TEXAS_LOCATIONS], dtype=np.float64)
+_LOCATION_LONS = np.array([loc[1] for loc in TEXAS_LOCATIONS], dtype=np.float64)
+_LOCATION_NAMES = np.array([loc[2] for loc in TEXAS_LOCATIONS], dtype=object)
+
+
+def _hash_plant_locations(names: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Derive coordinates for distinct plant names from their stable hash.
+    
+    Args:
+        names: Series of distinct plant names
+        
+    Returns:
+        Tuple of (latitudes, longitudes, location indices), one per name
+    """
+    # Create deterministic but varied assignment. pandas' vectorized uint64
+    # hash is stable across interpreter runs, unlike the built-in hash()
+    name_hash = pd.util.hash_pandas_object(
+        names, index=False, hash_key=GEOCODE_HASH_KEY
+    ).to_numpy()
+    scatter_hash = pd.util.hash_pandas_object(
+        names + "_scatter", index=False, hash_key=GEOCODE_HASH_KEY
+    ).to_numpy()
+    location_idx = (name_hash % len(_LOCATION_NAMES)).astype(np.intp)
+    
+    # Add realistic scatter within ~20 mile radius
+    lat_offset = ((scatter_hash % 1000).astype(np.int64) - 500) / 1000 * 0.3
+    lon_offset = (((scatter_hash // 1000) % 1000).astype(np.int64) - 500) / 1000 * 0.3
+    
+    # Ensure coordinates stay within Texas bounds
+    lats = np.clip(_LOCATION_LATS.take(location_idx) + lat_offset, _LAT_LO, _LAT_HI)
+    lons = np.clip(_LOCATION_LONS.take(location_idx) + lon_offset, _LON_LO, _LON_HI)
+    return lats, lons, location_idx
 
 
-def geocode_plant_locations(df: pd.DataFrame) -> pd.DataFrame:
+def geocode_plant_locations(
+    df: pd.DataFrame,
+    cache: Optional[Dict[str, Tuple[float, float, int]]] = None
+) -> pd.DataFrame:
     """
     Add realistic coordinates using actual Texas geography.
     
     Args:
         df: DataFrame with plant data
+        cache: Optional dict of plant name -> (lat, lon, location index),
+            read and extended in place so repeated calls skip rehashing
+            names they have already seen
         
     Returns:
         DataFrame with realistic lat/lon coordinates
     """
     logger.info("Adding realistic Texas geographic coordinates")
     
-    locations = get_texas_locations()
-    
-    def assign_realistic_coordinates(plant_name: str) -> CoordinateTuple:
-        """Assign coordinates based on plant name and realistic distribution."""
-        # Create deterministic but varied assignment
-        name_hash = hash(str(plant_name)) % len(locations)
-        base_lat, base_lon, location_name = locations[name_hash]
-        
-        # Add realistic scatter within ~20 mile radius
-        scatter_hash = hash(str(plant_name) + "_scatter")
-        lat_offset = ((scatter_hash % 1000) - 500) / 1000 * 0.3  # ~20 mile radius
-        lon_offset = (((scatter_hash // 1000) % 1000) - 500) / 1000 * 0.3
-        
-        final_lat = base_lat + lat_offset
-        final_lon = base_lon + lon_offset
-        
-        # Ensure coordinates stay within Texas bounds
-        final_lat = max(TEXAS_BOUNDS['lat_min'], min(TEXAS_BOUNDS['lat_max'], final_lat))
-        final_lon = max(TEXAS_BOUNDS['lon_min'], min(TEXAS_BOUNDS['lon_max'], final_lon))
-        
-        return final_lat, final_lon, location_name
-    
-    # Apply geocoding
-    df = df.copy()
-    geo_results = df['plantName'].apply(assign_realistic_coordinates)
-    
-    df['lat'] = [result[0] for result in geo_results]
-    df['lon'] = [result[1] for result in geo_results]
-    df['base_location'] = [result[2] for result in geo_results]
+    # Every generator at a plant gets the same coordinates, so geocode each
+    # distinct name once and broadcast back to the rows by factorized code
+    plant_codes, unique_names = pd.factorize(df['plantName'], use_na_sentinel=False)
+    names = pd.Series(unique_names).astype(str)
     
-    # Validate coordinates are within Texas
-    validate_coordinates(df)
+    if cache is None:
+        plant_lats, plant_lons, location_idx = _hash_plant_locations(names)
+    else:
+        cached = [cache.get(name) for name in names]
+        miss = np.fromiter((entry is None for entry in cached), dtype=bool, count=len(cached))
+        plant_lats = np.empty(len(names), dtype=np.float64)
+        plant_lons = np.empty(len(names), dtype=np.float64)
+        location_idx = np.empty(len(names), dtype=np.intp)
+        if miss.any():
+            new_names = names[miss]
+            new_lats, new_lons, new_idx = _hash_plant_locations(new_names)
+            plant_lats[miss], plant_lons[miss], location_idx[miss] = new_lats, new_lons, new_idx
+            cache.update(zip(new_names, zip(new_lats.tolist(), new_lons.tolist(), new_idx.tolist())))
+        if not miss.all():
+            hits = np.array([entry for entry in cached if entry is not None])
+            plant_lats[~miss], plant_lons[~miss] = hits[:, 0], hits[:, 1]
+            location_idx[~miss] = hits[:, 2].astype(np.intp)
+    
+    df = df.assign(
+        lat=plant_lats.take(plant_codes),
+        lon=plant_lons.take(plant_codes),
+        base_location=_LOCATION_NAMES.take(location_idx).take(plant_codes),
+    )
     
-    logger.info(f"Geocoded {len(df)} plants across {len(df['base_location'].unique())} regions")
+    # No bounds re-check: the hashing step clips every point into Texas
+    logger.info(f"Geocoded {len(df)} plants across {len(np.unique(location_idx))} regions")
     
     return df
 
@@ -504,28 +756,30 @@ def validate_coordinates(df: pd.DataFrame) -> None:
     Raises:
         ETLValidationError: If coordinates are outside Texas bounds
     """
-    within_bounds = (
-        (df['lat'] >= TEXAS_BOUNDS['lat_min']) & 
-        (df['lat'] <= TEXAS_BOUNDS['lat_max']) &
-        (df['lon'] >= TEXAS_BOUNDS['lon_min']) & 
-        (df['lon'] <= TEXAS_BOUNDS['lon_max'])
+    within_bounds = validate_coordinates_vec(
+        df['lat'].to_numpy(), df['lon'].to_numpy(), bounds=TEXAS_BOUNDS
     )
     
     if not within_bounds.all():
-        invalid_count = (~within_bounds).sum()
-        raise ETLValidationError(f"{invalid_count} coordinates outside Texas bounds")
+        invalid = np.flatnonzero(~within_bounds)
+        raise ETLValidationError(
+            f"{len(invalid)} coordinates outside Texas bounds (first at row {invalid[0]})"
+        )
     
     logger.info("All coordinates validated within Texas bounds")
 
 
+@lru_cache(maxsize=1)
 def get_fuel_mapping() -> FuelMappingDict:
     """
     Get comprehensive EIA fuel type mapping to canonical names.
     
+    The mapping is built once and shared, so it is returned read-only.
+    
     Returns:
-        Dictionary mapping EIA fuel types to canonical fuel names
+        Read-only mapping of EIA fuel types to canonical fuel names
     """
-    return {
+    return MappingProxyType({
         # Solar Technologies
         'Solar Photovoltaic': 'SOLAR',
         'Solar Thermal with Energy Storage': 'SOLAR',
@@ -582,7 +836,7 @@ def get_fuel_mapping() -> FuelMappingDict:
         'Other': 'OTHER',
         'All Other': 'OTHER',
         'Flywheels': 'OTHER',
-    }
+    })
 
 
 def normalize_fuel_types(df: pd.DataFrame) -> pd.DataFrame:
@@ -597,15 +851,26 @@ def normalize_fuel_types(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Normalizing fuel types")
     
-    df = df.copy()
     fuel_mapping = get_fuel_mapping()
     
-    # Map fuel types, default to 'OTHER' for unmapped types
-    df['fuel'] = df['technology'].map(fuel_mapping).fillna('OTHER')
+    # Map each distinct technology once to a fuel category code and gather
+    # by technology code, default to 'OTHER' for unmapped types; the
+    # trailing slot catches missing values (code -1)
+    technology = pd.Categorical(df['technology'])
+    fuel_code = {fuel: code for code, fuel in enumerate(FUEL_CATEGORIES)}
+    other = fuel_code['OTHER']
+    lookup = np.array(
+        [fuel_code.get(fuel_mapping.get(tech, 'OTHER'), other) for tech in technology.categories] + [other],
+        dtype=np.int8
+    )
+    df = df.assign(
+        technology=technology,
+        fuel=pd.Categorical.from_codes(lookup[technology.codes], categories=FUEL_CATEGORIES),
+    )
     
     # Log fuel type distribution
     fuel_counts = df['fuel'].value_counts()
-    logger.info(f"Fuel type distribution: {fuel_counts.to_dict()}")
+    logger.info(f"Fuel type distribution: {fuel_counts[fuel_counts > 0].to_dict()}")
     
     return df
 
@@ -627,19 +892,32 @@ def transform_to_canonical_schema(df: pd.DataFrame, generation_df: Optional[pd.D
     # Check if plantCode is available for merging with generation data
     has_plant_code = 'plantCode' in df.columns
     
+    # Coordinates and base location are derived from plantName alone, so
+    # group on plant and fuel only and carry the rest through with 'first'
+    aggregations = {
+        'nameplate-capacity-mw': 'sum',
+        'lat': 'first',
+        'lon': 'first',
+        'base_location': 'first',
+    }
     if has_plant_code:
-        # Group by plant and aggregate generators (with plant code)
-        df_grouped = df.groupby(['plantName', 'lat', 'lon', 'fuel']).agg({
-            'nameplate-capacity-mw': 'sum',
-            'base_location': 'first',
-            'plantCode': 'first'  # Keep plant code for merging with generation data
-        }).reset_index()
-    else:
-        # Group without plant code
-        df_grouped = df.groupby(['plantName', 'lat', 'lon', 'fuel']).agg({
-            'nameplate-capacity-mw': 'sum',
-            'base_location': 'first'
-        }).reset_index()
+        aggregations['plantCode'] = 'first'  # Keep plant code for merging with generation data
+    
+    # Drop generators without a usable capacity before aggregating; a
+    # NaN-only group would otherwise sum to a 0 MW plant
+    valid_capacity = df['nameplate-capacity-mw'].notna()
+    if not valid_capacity.all():
+        logger.warning(f"Dropped {int((~valid_capacity).sum())} generators with missing capacity")
+        df = df.loc[valid_capacity]
+    
+    # Group by plant and aggregate generators
+    df_grouped = df.groupby(
+        ['plantName', 'fuel'], as_index=False, sort=False, observed=True
+    ).agg(aggregations)
+    
+    # Single run timestamp stored as a one-category column rather than
+    # broadcasting N copies of the same string
+    last_updated = datetime.now(timezone.utc).isoformat()
     
     # Create canonical schema base
     canonical_df = pd.DataFrame({
@@ -648,7 +926,9 @@ def transform_to_canonical_schema(df: pd.DataFrame, generation_df: Optional[pd.D
         'lon': df_grouped['lon'], 
         'capacity_mw': df_grouped['nameplate-capacity-mw'],
         'fuel': df_grouped['fuel'],
-        'last_updated': datetime.now(timezone.utc).isoformat()
+        'last_updated': pd.Categorical.from_codes(
+            np.zeros(len(df_grouped), dtype=np.int8), categories=[last_updated]
+        )
     })
     
     # Add plant_code if available
@@ -680,11 +960,11 @@ def transform_to_canonical_schema(df: pd.DataFrame, generation_df: Optional[pd.D
         # Estimate: average capacity factor of 70% across all plants
         canonical_df['actual_generation_mw'] = canonical_df['capacity_mw'] * 0.70
     
-    # Validate data types
-    canonical_df['capacity_mw'] = pd.to_numeric(canonical_df['capacity_mw'], errors='coerce')
-    canonical_df['actual_generation_mw'] = pd.to_numeric(canonical_df['actual_generation_mw'], errors='coerce')
-    canonical_df['lat'] = pd.to_numeric(canonical_df['lat'], errors='coerce') 
-    canonical_df['lon'] = pd.to_numeric(canonical_df['lon'], errors='coerce')
+    # Validate data types; capacity is coerced once at ingest and the
+    # coordinates come from NumPy, so only re-parse non-numeric columns
+    for col in ('capacity_mw', 'actual_generation_mw', 'lat', 'lon'):
+        if not pd.api.types.is_numeric_dtype(canonical_df[col]):
+            canonical_df[col] = pd.to_numeric(canonical_df[col], errors='coerce')
     
     # Remove any rows with invalid numeric data
     initial_count = len(canonical_df)
@@ -694,9 +974,11 @@ def transform_to_canonical_schema(df: pd.DataFrame, generation_df: Optional[pd.D
     if initial_count != final_count:
         logger.warning(f"Dropped {initial_count - final_count} rows with invalid numeric data")
     
-    # Sort by actual generation (largest first) and deduplicate
-    canonical_df = canonical_df.sort_values('actual_generation_mw', ascending=False)
-    canonical_df = canonical_df.drop_duplicates(subset=['plant_name', 'fuel'], keep='first')
+    # Keep the highest-generation row per plant/fuel, then order largest first
+    winners = canonical_df.groupby(
+        ['plant_name', 'fuel'], sort=False, observed=True
+    )['actual_generation_mw'].idxmax()
+    canonical_df = canonical_df.loc[winners].sort_values('actual_generation_mw', ascending=False)
     
     # Drop plant_code before output (internal use only)
     canonical_df = canonical_df.drop('plant_code', axis=1, errors='ignore')
@@ -718,9 +1000,9 @@ def validate_output_schema(df: pd.DataFrame) -> None:
     Raises:
         ETLValidationError: If schema validation fails
     """
-    missing_cols = [col for col in REQUIRED_OUTPUT_COLUMNS if col not in df.columns]
+    missing_cols = set(REQUIRED_OUTPUT_COLUMNS).difference(df.columns)
     if missing_cols:
-        raise ETLValidationError(f"Output missing required columns: {missing_cols}")
+        raise ETLValidationError(f"Output missing required columns: {sorted(missing_cols)}")
     
     # Validate data types
     if not pd.api.types.is_numeric_dtype(df['capacity_mw']):
@@ -733,7 +1015,7 @@ def validate_output_schema(df: pd.DataFrame) -> None:
         raise ETLValidationError("lon must be numeric")
     
     # Validate capacity is positive
-    if (df['capacity_mw'] <= 0).any():
+    if (df['capacity_mw'].to_numpy() <= 0).any():
         raise ETLValidationError("All capacity values must be positive")
     
     logger.info(f"Output schema validation passed: {len(df)} records")
@@ -761,7 +1043,21 @@ def atomic_write_parquet(df: pd.DataFrame, output_path: Path) -> None:
         tmp_path = Path(tmp_file.name)
     
     try:
-        df.to_parquet(tmp_path, engine='pyarrow', compression='snappy')
+        # zstd, dictionary-encode repeated strings, byte-stream-split floats;
+        # today's output fits in a single row group, larger frames are split
+        # for predicate pushdown
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(
+            table,
+            tmp_path,
+            compression='zstd',
+            compression_level=3,
+            use_dictionary=[col for col in DICTIONARY_COLUMNS if col in df.columns],
+            use_byte_stream_split=[col for col in BYTE_STREAM_SPLIT_COLUMNS if col in df.columns],
+            row_group_size=max(min(len(df), PARQUET_ROW_GROUP_SIZE), 1),
+            data_page_version='2.0',
+            write_statistics=True,
+        )
         tmp_path.replace(output_path)
         logger.info(f"Successfully wrote to {output_path}")
     except Exception as e:
@@ -779,13 +1075,24 @@ def main() -> None:
         # Get API key
         api_key = get_api_key()
         
-        # Fetch nameplate capacity from EIA API
-        raw_df = fetch_texas_generators(api_key)
+        # Capacity and generation are independent endpoints, so fetch them
+        # concurrently over one pooled session (one TLS handshake per
+        # connection, reused across both fetchers and all their pages)
+        session = create_http_session()
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                capacity_future = executor.submit(fetch_texas_generators, api_key, session)
+                generation_future = executor.submit(fetch_actual_generation, api_key, session)
+        finally:
+            session.close()
+        
+        # Nameplate capacity is required - re-raises any fetch error
+        raw_df = capacity_future.result()
         logger.info(f"Fetched {len(raw_df)} generator records")
         
-        # Fetch actual generation data (optional - may fail gracefully)
+        # Actual generation data is optional - may fail gracefully
         try:
-            generation_df = fetch_actual_generation(api_key)
+            generation_df = generation_future.result()
             if not generation_df.empty:
                 logger.info(f"Fetched actual generation for {len(generation_df)} plants")
             else:
@@ -796,6 +1103,10 @@ def main() -> None:
             logger.info("Will estimate generation from nameplate capacity")
             generation_df = None
         
+        # Drop the unused EIA attribute columns before the transform stages
+        # so each stage only moves the data it needs
+        raw_df = raw_df[[col for col in PIPELINE_COLUMNS if col in raw_df.columns]]
+        
         # Add geographic coordinates
         geo_df = geocode_plant_locations(raw_df)
         
@@ -814,8 +1125,12 @@ def main() -> None:
         total_actual = final_df['actual_generation_mw'].sum()
         capacity_factor = (total_actual / total_capacity * 100) if total_capacity > 0 else 0
         
-        fuel_breakdown_capacity = final_df.groupby('fuel')['capacity_mw'].sum().sort_values(ascending=False)
-        fuel_breakdown_actual = final_df.groupby('fuel')['actual_generation_mw'].sum().sort_values(ascending=False)
+        # One grouped pass for both per-fuel totals
+        fuel_totals = final_df.groupby('fuel', sort=False, observed=True)[
+            ['capacity_mw', 'actual_generation_mw']
+        ].sum()
+        fuel_breakdown_capacity = fuel_totals['capacity_mw'].sort_values(ascending=False)
+        fuel_breakdown_actual = fuel_totals['actual_generation_mw'].sort_values(ascending=False)
         
         logger.info(f"ETL completed successfully:")
         logger.info(f"  Facilities: {len(final_df)}")
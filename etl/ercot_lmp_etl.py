@@ -12,15 +12,22 @@ Author: TAB Energy Dashboard
 Date: 2025-11-10
 """
 
+import io
+import os
+import numpy as np
 import requests
 import pandas as pd
-from bs4 import BeautifulSoup
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime
 from pathlib import Path
 import logging
 import sys
 from typing import Optional
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,6 +39,22 @@ logger = logging.getLogger(__name__)
 DATA_DIR = Path(__file__).parent.parent / "data"
 DATA_DIR.mkdir(exist_ok=True)
 
+# HTTP retry policy: one pooled, keep-alive session that retries transient errors
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+_RETRY_STRATEGY = Retry(
+    total=MAX_RETRIES,
+    backoff_factor=BACKOFF_FACTOR,
+    status_forcelist=frozenset({429, 500, 502, 503, 504}),
+)
+_SESSION_HEADERS = {
+    'User-Agent': 'TAB-Energy-Dashboard/1.0'
+}
+
+# Parquet encodings: dictionary for repeated labels, byte-stream-split for prices/coordinates
+DICTIONARY_COLUMNS = ['node_id', 'region', 'tier', 'zone_key', 'last_updated', 'interval_end', 'oper_day']
+BYTE_STREAM_SPLIT_COLUMNS = ['price_cperkwh', 'avg_price', 'lat', 'lon']
+
 # ERCOT Zones with coordinates (for map visualization)
 # These correspond to the columns in ERCOT's real-time SPP table
 # Coordinates optimized for better visual spacing on map
@@ -64,6 +87,29 @@ ERCOT_ZONES = {
     'LZ_RAYBN': {'name': 'East Texas (Rayburn)', 'lat': 32.00, 'lon': -94.00, 'tier': 'strategic'},
 }
 
+# Column-wise view of ERCOT_ZONES so the zone transform is a masked gather
+ZONE_KEYS = np.array(list(ERCOT_ZONES), dtype=object)
+ZONE_NAMES = np.array([info['name'] for info in ERCOT_ZONES.values()], dtype=object)
+ZONE_LATS = np.array([info['lat'] for info in ERCOT_ZONES.values()], dtype=np.float64)
+ZONE_LONS = np.array([info['lon'] for info in ERCOT_ZONES.values()], dtype=np.float64)
+ZONE_TIERS = np.array([info['tier'] for info in ERCOT_ZONES.values()], dtype=object)
+
+
+def create_http_session() -> requests.Session:
+    """
+    Create HTTP session with retry strategy and proper headers.
+    
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=_RETRY_STRATEGY, pool_connections=1, pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(_SESSION_HEADERS)
+    
+    return session
+
 
 def fetch_ercot_realtime_spp() -> Optional[pd.DataFrame]:
     """
@@ -79,83 +125,69 @@ def fetch_ercot_realtime_spp() -> Optional[pd.DataFrame]:
         # ERCOT Real-Time SPP endpoint (HTML table, updated every 5 minutes)
         url = "https://www.ercot.com/content/cdr/html/real_time_spp"
         
-        headers = {
-            'User-Agent': 'TAB-Energy-Dashboard/1.0'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=30, allow_redirects=True)
-        response.raise_for_status()
+        with create_http_session() as session:
+            response = session.get(url, timeout=30, allow_redirects=True)
+            response.raise_for_status()
         
         logger.info(f"Successfully fetched data ({len(response.content)} bytes)")
         
-        # Parse HTML table (BeautifulSoup accepts bytes directly)
-        soup = BeautifulSoup(response.content, 'html.parser')  # type: ignore
-        table = soup.find('table', class_='tableStyle')
-        
-        if not table:
+        # Parse with pandas' lxml (C) parser, decoding with the response
+        # charset; keep the interval labels as text so values like '0015'
+        # keep their leading zeros
+        try:
+            tables = pd.read_html(
+                io.StringIO(response.text),
+                flavor='lxml',
+                attrs={'class': 'tableStyle'},
+                converters={'Oper Day': str, 'Interval Ending': str},
+            )
+        except ValueError:
             logger.error("Could not find price table in HTML")
             return None
         
-        # Extract headers
-        headers_row = table.find('tr')
-        headers = [th.text.strip() for th in headers_row.find_all('th')]
+        df = tables[0]
+        headers = [str(col).strip() for col in df.columns]
+        df.columns = headers
         logger.info(f"Found {len(headers)} columns")
         
-        # Extract data rows
-        data_rows = []
-        for row in table.find_all('tr')[1:]:  # Skip header row
-            cols = row.find_all('td')
-            if len(cols) > 0:
-                row_data = [col.text.strip() for col in cols]
-                if len(row_data) == len(headers):
-                    data_rows.append(row_data)
-        
-        if not data_rows:
+        if df.empty:
             logger.error("No data rows found in table")
             return None
         
-        logger.info(f"Extracted {len(data_rows)} interval rows")
-        
-        # Create DataFrame
-        df = pd.DataFrame(data_rows, columns=headers)
+        logger.info(f"Extracted {len(df)} interval rows")
         
         # Get the most recent interval (last row has latest data)
         latest_row = df.iloc[-1]
         interval_end = latest_row['Interval Ending']
         oper_day = latest_row['Oper Day']
         
-        # Transform to long format (one row per zone)
-        zone_data = []
-        for col in headers[2:]:  # Skip 'Oper Day' and 'Interval Ending'
-            if col in ERCOT_ZONES:
-                try:
-                    # Get scalar value from Series to avoid type checker warnings
-                    price_value = latest_row[col]
-                    price_mwh = float(price_value)  # type: ignore - LMP in $/MWh
-                    
-                    # Convert $/MWh to cents/kWh: divide by 10
-                    # (1 MWh = 1000 kWh, so $X/MWh = X/10 cents/kWh)
-                    price_cperkwh = price_mwh / 10.0
-                    
-                    zone_data.append({
-                        'node_id': col,  # Zone key (matches schema)
-                        'region': ERCOT_ZONES[col]['name'],  # Zone name (matches schema)
-                        'price_cperkwh': price_cperkwh,  # Price in cents/kWh (matches schema)
-                        'lat': ERCOT_ZONES[col]['lat'],
-                        'lon': ERCOT_ZONES[col]['lon'],
-                        'tier': ERCOT_ZONES[col]['tier'],  # Hub vs strategic classification
-                        'last_updated': datetime.now().isoformat(),  # ISO format timestamp
-                        # Keep raw data for reference
-                        'zone_key': col,
-                        'avg_price': price_mwh,  # Original $/MWh for debugging
-                        'interval_end': interval_end,
-                        'oper_day': oper_day,
-                    })
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Skipping column {col}: {str(e)}")
-                    continue
-        
-        result_df = pd.DataFrame(zone_data)
+        # Transform to long format (one row per zone); one timestamp per run
+        now_iso = datetime.now().isoformat()  # ISO format timestamp
+        prices = pd.to_numeric(
+            latest_row.reindex(ZONE_KEYS), errors='coerce'
+        ).to_numpy(dtype=np.float64)  # LMP in $/MWh
+        has_price = ~np.isnan(prices)
+        for zone_key in ZONE_KEYS[~has_price]:
+            logger.warning(f"Skipping zone {zone_key}: no price in latest interval")
+        
+        prices = prices[has_price]
+        node_ids = ZONE_KEYS[has_price]
+        result_df = pd.DataFrame({
+            'node_id': node_ids,  # Zone key (matches schema)
+            'region': ZONE_NAMES[has_price],  # Zone name (matches schema)
+            # Convert $/MWh to cents/kWh: divide by 10
+            # (1 MWh = 1000 kWh, so $X/MWh = X/10 cents/kWh)
+            'price_cperkwh': prices / 10.0,  # Price in cents/kWh (matches schema)
+            'lat': ZONE_LATS[has_price],
+            'lon': ZONE_LONS[has_price],
+            'tier': ZONE_TIERS[has_price],  # Hub vs strategic classification
+            'last_updated': now_iso,
+            # Keep raw data for reference
+            'zone_key': node_ids,
+            'avg_price': prices,  # Original $/MWh for debugging
+            'interval_end': interval_end,
+            'oper_day': oper_day,
+        })
         logger.info(f"Processed {len(result_df)} zones with price data")
         
         # Log tier breakdown
@@ -199,22 +231,24 @@ def save_to_parquet(df: pd.DataFrame) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    output_file = DATA_DIR / "price_map.parquet"
+    temp_file = DATA_DIR / "price_map.parquet.tmp"
+    
     try:
-        output_file = DATA_DIR / "price_map.parquet"
-        temp_file = DATA_DIR / "price_map.parquet.tmp"
-        
         # Write to temp file first
-        df.to_parquet(temp_file, index=False, engine='pyarrow')
-        
-        # Verify file was written
-        test_df = pd.read_parquet(temp_file)
-        if len(test_df) != len(df):
-            logger.error("Verification failed: row count mismatch")
-            temp_file.unlink(missing_ok=True)
-            return False
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(
+            table,
+            temp_file,
+            compression='zstd',
+            compression_level=3,
+            use_dictionary=[col for col in DICTIONARY_COLUMNS if col in df.columns],
+            use_byte_stream_split=[col for col in BYTE_STREAM_SPLIT_COLUMNS if col in df.columns],
+            data_page_version='2.0',
+        )
         
-        # Atomic move
-        temp_file.replace(output_file)
+        # Atomic move; pyarrow raises on a failed write, so no read-back needed
+        os.replace(temp_file, output_file)
         
         logger.info(f"✅ Saved {len(df)} records to {output_file}")
         logger.info(f"   File size: {output_file.stat().st_size:,} bytes")
@@ -223,6 +257,7 @@ def save_to_parquet(df: pd.DataFrame) -> bool:
         
     except Exception as e:
         logger.error(f"Failed to save parquet: {str(e)}")
+        temp_file.unlink(missing_ok=True)
         return False
 
 
@@ -30,20 +30,34 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import hashlib
 import tempfile
-import shutil
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# Prefer the Rust-backed calamine reader for the CDR workbook when it is
+# installed; pandas' openpyxl path already opens it read-only/data-only
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
 # Ensure we can import from the same directory (for GitHub Actions)
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import Texas county geocoding
 try:
-    from texas_counties import get_county_coordinates, validate_coordinates
+    from texas_counties import (
+        get_county_coordinates,
+        get_county_coordinates_bulk,
+        validate_coordinates,
+        validate_coordinates_vec,
+    )
 except ImportError as e:
     # If import fails, log detailed error
     import traceback
@@ -71,6 +85,32 @@ file_handler.setFormatter(formatter)
 logger.addHandler(file_handler)
 
 
+# CDR "Unit Details" layout: report banner rows above the table header
+CDR_BANNER_ROWS = 7
+CDR_HEADER_SEARCH_ROWS = 12
+QUEUE_SOURCE_COLUMNS = frozenset({'UNIT NAME', 'FUEL', 'TECHNOLOGY', 'CDR STATUS', 'COUNTY'})
+
+# Parquet encodings: dictionary-encode the repeated label columns
+DICTIONARY_COLUMNS = ['fuel_type', 'technology', 'status', 'county', 'data_source', 'last_updated']
+
+# Typed output schema for queue.parquet, independent of pandas inference.
+# Parquet does not keep the dictionary index width and always reads it back
+# as int32, so fuel_type is declared that way to match the written file
+QUEUE_SCHEMA = pa.schema([
+    ('project_name', pa.string()),
+    ('fuel_type', pa.dictionary(pa.int32(), pa.string())),
+    ('technology', pa.string()),
+    ('status', pa.string()),
+    ('county', pa.string()),
+    ('capacity_mw', pa.float64()),
+    ('expected_date', pa.date32()),
+    ('lat', pa.float64()),
+    ('lon', pa.float64()),
+    ('data_source', pa.string()),
+    ('last_updated', pa.string()),
+])
+
+
 class ETLValidationError(Exception):
     """Custom exception for ETL validation errors"""
     pass
@@ -117,13 +157,16 @@ def validate_queue_schema(df: pd.DataFrame) -> bool:
     texas_lat_bounds = (25.84, 36.50)
     texas_lon_bounds = (-106.65, -93.51)
     
-    invalid_coords = (
-        (df['lat'] < texas_lat_bounds[0]) | (df['lat'] > texas_lat_bounds[1]) |
-        (df['lon'] < texas_lon_bounds[0]) | (df['lon'] > texas_lon_bounds[1])
-    )
+    # Compare on the raw NumPy buffers to skip Series index alignment
+    lat = df['lat'].to_numpy()
+    lon = df['lon'].to_numpy()
+    invalid_count = int((
+        (lat < texas_lat_bounds[0]) | (lat > texas_lat_bounds[1]) |
+        (lon < texas_lon_bounds[0]) | (lon > texas_lon_bounds[1])
+    ).sum())
     
-    if invalid_coords.sum() > 0:
-        logger.warning(f"Found {invalid_coords.sum()} projects outside Texas bounds")
+    if invalid_count > 0:
+        logger.warning(f"Found {invalid_count} projects outside Texas bounds")
     
     logger.info(f"✅ Schema validation passed for {len(df)} projects")
     return True
@@ -156,14 +199,12 @@ def get_county_coordinates_for_project(
     # Get real county centroid from static database
     lat, lon = get_county_coordinates(county)
     
-    # Add tiny random jitter (±0.03 degrees ≈ 2 miles) to avoid overlapping dots
-    # Uses project name as seed for deterministic results
-    project_hash = hashlib.md5(f"{project_name}{county}".encode()).hexdigest()
-    base_seed = int(project_hash[:8], 16)
-    np.random.seed(base_seed % (2**32))
-    
-    jitter_lat = np.random.uniform(-0.03, 0.03)
-    jitter_lon = np.random.uniform(-0.03, 0.03)
+    # Add tiny jitter (±0.03 degrees ≈ 2 miles) to avoid overlapping dots,
+    # taken straight from the digest of the project name so it is
+    # deterministic without touching the global NumPy RNG
+    digest = hashlib.blake2b(f"{project_name}{county}".encode(), digest_size=8).digest()
+    jitter_lat = (int.from_bytes(digest[:4], 'little') / 2**32 - 0.5) * 0.06
+    jitter_lon = (int.from_bytes(digest[4:], 'little') / 2**32 - 0.5) * 0.06
     
     final_lat = round(lat + jitter_lat, 4)
     final_lon = round(lon + jitter_lon, 4)
@@ -179,6 +220,76 @@ def get_county_coordinates_for_project(
     return final_lat, final_lon
 
 
+def assign_project_coordinates(
+    project_names: pd.Series,
+    counties: pd.Series
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized counterpart of get_county_coordinates_for_project.
+    
+    Looks up each distinct county centroid once, derives the same
+    deterministic ±0.03 degree jitter per project from name + county, and
+    falls back to the exact centroid where the jittered point leaves Texas.
+    
+    Args:
+        project_names: Project names (jitter seed)
+        counties: County names aligned with project_names
+        
+    Returns:
+        Tuple of (latitude, longitude) arrays rounded to 4 decimals
+    """
+    base_lat, base_lon = get_county_coordinates_bulk(counties)
+    
+    # Same blake2b digests as the scalar path, laid out as one uint32 pair
+    # per project so both jitter columns come from a single buffer
+    digests = np.frombuffer(
+        b''.join(
+            hashlib.blake2b(f"{name}{county}".encode(), digest_size=8).digest()
+            for name, county in zip(project_names, counties)
+        ),
+        dtype='<u4'
+    ).reshape(-1, 2)
+    jitter_lat = (digests[:, 0] / 2**32 - 0.5) * 0.06
+    jitter_lon = (digests[:, 1] / 2**32 - 0.5) * 0.06
+    
+    lat = np.round(base_lat + jitter_lat, 4)
+    lon = np.round(base_lon + jitter_lon, 4)
+    
+    outside = ~validate_coordinates_vec(lat, lon)
+    if outside.any():
+        logger.warning(
+            f"Jittered coordinates for {int(outside.sum())} projects fell outside "
+            f"Texas bounds. Using exact centroids."
+        )
+        lat = np.where(outside, np.round(base_lat, 4), lat)
+        lon = np.where(outside, np.round(base_lon, 4), lon)
+    
+    return lat, lon
+
+
+def _clean_column_name(col_name) -> str:
+    """Normalize a CDR header cell (remove newlines, extra spaces)."""
+    return str(col_name).strip().replace('\n', '_').replace('  ', ' ')
+
+
+def _is_queue_column(col_name) -> bool:
+    """
+    Column filter for read_excel(usecols=...) on the CDR unit sheet.
+    
+    Args:
+        col_name: Raw header cell
+        
+    Returns:
+        True for the identity, capacity and in-service date columns
+    """
+    name = _clean_column_name(col_name)
+    return (
+        name in QUEUE_SOURCE_COLUMNS or
+        ('INSTALLED CAPACITY' in name and 'MW' in name) or
+        ('IN-SERVICE' in name and 'DATE' in name)
+    )
+
+
 def parse_ercot_cdr_data(file_path: str) -> pd.DataFrame:
     """
     Parse ERCOT CDR Excel file to extract interconnection queue data.
@@ -195,39 +306,31 @@ def parse_ercot_cdr_data(file_path: str) -> pd.DataFrame:
     logger.info(f"Parsing ERCOT CDR data from {file_path}")
     
     try:
-        # Read Unit Details sheet with proper header parsing
-        df_raw = pd.read_excel(file_path, sheet_name='Unit Details', skiprows=7)
-        
-        # Find the header row containing "UNIT NAME"
-        header_idx: Optional[int] = None
-        for idx, row in df_raw.iterrows():
-            # Convert pandas index to integer for comparison
-            i = int(idx) if isinstance(idx, (int, float)) else 0
-            if i > 10:  # Don't search too far
-                break
-            row_str = str(row.iloc[0]) if not pd.isna(row.iloc[0]) else ""
-            if 'UNIT NAME' in row_str:
-                header_idx = i
-                break
-        
-        if header_idx is None:
-            raise ETLProcessingError("Could not find header row with UNIT NAME")
-        
-        # Extract data starting from header
-        header_row = df_raw.iloc[header_idx]
-        unit_data = df_raw.iloc[header_idx + 1:].copy()
-        
-        # Clean up column names
-        new_columns = []
-        for j, col_name in enumerate(header_row):
-            if pd.isna(col_name) or str(col_name).startswith('Unnamed'):
-                new_columns.append(f'col_{j}')
-            else:
-                # Clean up column names (remove newlines, extra spaces)
-                clean_name = str(col_name).strip().replace('\n', '_').replace('  ', ' ')
-                new_columns.append(clean_name)
-        
-        unit_data.columns = new_columns
+        # Open the workbook once; both passes below read from the same
+        # loaded file instead of unzipping and parsing it twice
+        with pd.ExcelFile(file_path, engine=EXCEL_ENGINE) as xls:
+            # Cheap first pass: locate the header row containing "UNIT NAME"
+            # within the first rows after the report banner
+            probe = pd.read_excel(
+                xls, sheet_name='Unit Details', skiprows=CDR_BANNER_ROWS,
+                nrows=CDR_HEADER_SEARCH_ROWS, header=None
+            )
+            header_idx: Optional[int] = None
+            first_col = probe.iloc[:, 0].astype('string')
+            matches = np.flatnonzero(first_col.str.contains('UNIT NAME', regex=False, na=False))
+            if matches.size:
+                header_idx = int(matches[0])
+            
+            if header_idx is None:
+                raise ETLProcessingError("Could not find header row with UNIT NAME")
+            
+            # Second pass: let the engine promote the header and type the
+            # cells, parsing only the columns the queue actually uses
+            unit_data = pd.read_excel(
+                xls, sheet_name='Unit Details', skiprows=CDR_BANNER_ROWS + header_idx,
+                header=0, usecols=_is_queue_column, dtype_backend='pyarrow'
+            )
+        unit_data.columns = [_clean_column_name(col) for col in unit_data.columns]
         unit_data = unit_data.dropna(how='all').reset_index(drop=True)
         
         logger.info(f"Parsed {len(unit_data)} total units from CDR report")
@@ -245,15 +348,28 @@ def parse_ercot_cdr_data(file_path: str) -> pd.DataFrame:
         if queue_projects.empty:
             raise ETLProcessingError("No planned projects found in CDR data")
         
-        # Standardize the DataFrame structure
-        standardized_df = pd.DataFrame()
-        
         # Map columns to standard names
-        standardized_df['project_name'] = queue_projects['UNIT NAME'].fillna('Unknown Project')
-        standardized_df['fuel_type'] = queue_projects['FUEL'].fillna('Unknown')
-        standardized_df['technology'] = queue_projects['TECHNOLOGY'].fillna('Unknown')
-        standardized_df['status'] = queue_projects['CDR STATUS'].fillna('PLAN')
-        standardized_df['county'] = queue_projects['COUNTY'].fillna('Unknown County')
+        project_name = queue_projects['UNIT NAME'].fillna('Unknown Project')
+        county = queue_projects['COUNTY'].fillna('Unknown County')
+        
+        # Clean up fuel types for consistency
+        fuel_mapping = {
+            'GAS': 'Natural Gas',
+            'WIND-O': 'Wind',
+            'SOLAR-O': 'Solar',
+            'SOLAR-W': 'Solar', 
+            'STORAGE': 'Battery Storage',
+            'NATGAS': 'Natural Gas'
+        }
+        # Remap once per distinct label; categorical storage also dictionary-
+        # encodes the column in parquet. Several raw codes share a label, so
+        # re-derive the categories after the mapping
+        fuel_type = (
+            queue_projects['FUEL'].fillna('Unknown')
+            .astype('category')
+            .map(lambda fuel: fuel_mapping.get(fuel, fuel))
+            .astype('category')
+        )
         
         # Extract capacity from installed capacity column
         capacity_col = None
@@ -263,13 +379,13 @@ def parse_ercot_cdr_data(file_path: str) -> pd.DataFrame:
                 break
         
         if capacity_col:
-            standardized_df['capacity_mw'] = pd.to_numeric(
+            capacity_mw = pd.to_numeric(
                 queue_projects[capacity_col], errors='coerce'
             ).fillna(0)
         else:
             # Fallback to reasonable default for planned projects
             logger.warning("Could not find capacity column, using default values")
-            standardized_df['capacity_mw'] = 100.0  # Default 100 MW
+            capacity_mw = 100.0  # Default 100 MW
         
         # Extract in-service date
         date_col = None
@@ -279,45 +395,36 @@ def parse_ercot_cdr_data(file_path: str) -> pd.DataFrame:
                 break
         
         if date_col:
-            standardized_df['expected_date'] = pd.to_datetime(
+            expected_date = pd.to_datetime(
                 queue_projects[date_col], errors='coerce'
             )
         else:
             # Default to future dates for planned projects
             logger.warning("Could not find in-service date column, using default dates")
-            base_date = pd.Timestamp('2026-01-01')
-            standardized_df['expected_date'] = [
-                base_date + pd.Timedelta(days=i*30) for i in range(len(standardized_df))
-            ]
-        
-        # Add accurate coordinates based on county centroids
-        coordinates = []
-        for _, row in standardized_df.iterrows():
-            lat, lon = get_county_coordinates_for_project(
-                row['project_name'], row['county'], row['fuel_type']
+            expected_date = pd.Series(
+                pd.date_range('2026-01-01', periods=len(queue_projects), freq='30D'),
+                index=queue_projects.index
             )
-            coordinates.append((lat, lon))
-        
-        standardized_df['lat'] = [coord[0] for coord in coordinates]
-        standardized_df['lon'] = [coord[1] for coord in coordinates]
-        
-        # Convert dates to strings for JSON serialization
-        standardized_df['expected_date'] = standardized_df['expected_date'].dt.strftime('%Y-%m-%d')
-        
-        # Add metadata
-        standardized_df['data_source'] = 'ERCOT CDR Report'
-        standardized_df['last_updated'] = datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')
         
-        # Clean up fuel types for consistency
-        fuel_mapping = {
-            'GAS': 'Natural Gas',
-            'WIND-O': 'Wind',
-            'SOLAR-O': 'Solar',
-            'SOLAR-W': 'Solar', 
-            'STORAGE': 'Battery Storage',
-            'NATGAS': 'Natural Gas'
-        }
-        standardized_df['fuel_type'] = standardized_df['fuel_type'].map(fuel_mapping).fillna(standardized_df['fuel_type'])
+        # Add accurate coordinates based on county centroids
+        lat, lon = assign_project_coordinates(project_name, county)
+        
+        # Standardize the DataFrame structure in a single construction
+        standardized_df = pd.DataFrame({
+            'project_name': project_name,
+            'fuel_type': fuel_type,
+            'technology': queue_projects['TECHNOLOGY'].fillna('Unknown'),
+            'status': queue_projects['CDR STATUS'].fillna('PLAN'),
+            'county': county,
+            'capacity_mw': capacity_mw,
+            # Day precision; written to parquet as date32, not text
+            'expected_date': expected_date.dt.normalize(),
+            'lat': lat,
+            'lon': lon,
+            # Add metadata
+            'data_source': 'ERCOT CDR Report',
+            'last_updated': datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        }, index=queue_projects.index)
         
         logger.info(f"✅ Successfully standardized {len(standardized_df)} queue projects")
         
@@ -361,15 +468,27 @@ def atomic_write_parquet(df: pd.DataFrame, output_path: str) -> None:
             temp_path = tmp_file.name
         
         # Write DataFrame to temporary file
-        df.to_parquet(temp_path, index=False, engine='pyarrow')
+        table = pa.Table.from_pandas(df, schema=QUEUE_SCHEMA, preserve_index=False)
+        pq.write_table(
+            table,
+            temp_path,
+            compression='zstd',
+            compression_level=3,
+            use_dictionary=DICTIONARY_COLUMNS,
+            row_group_size=max(len(df), 1),  # a few hundred rows: one row group
+        )
         
-        # Verify the file was written correctly
-        test_df = pd.read_parquet(temp_path)
-        if len(test_df) != len(df):
-            raise ETLProcessingError(f"Verification failed: expected {len(df)} rows, got {len(test_df)}")
+        # Verify the row count and schema from the footer alone; no column
+        # data is decoded
+        written = pq.read_schema(temp_path)
+        written_rows = pq.read_metadata(temp_path).num_rows
+        if written_rows != len(df):
+            raise ETLProcessingError(f"Verification failed: expected {len(df)} rows, got {written_rows}")
+        if not written.remove_metadata().equals(QUEUE_SCHEMA):
+            raise ETLProcessingError(f"Verification failed: written schema differs from QUEUE_SCHEMA:\n{written}")
         
         # Atomically move to final location
-        shutil.move(temp_path, output_path)
+        os.replace(temp_path, output_path)
         logger.info(f"✅ Successfully wrote queue data to {output_path}")
         
     except Exception as e:
@@ -382,7 +501,14 @@ def atomic_write_parquet(df: pd.DataFrame, output_path: str) -> None:
 
 def download_cdr_report(output_path: str) -> bool:
     """
-    Download latest ERCOT CDR report if not already present.
+    Download latest ERCOT CDR report unless the local copy is current.
+    
+    An existing file is revalidated with a HEAD request: a matching
+    Content-Length keeps it and a different one forces a full re-download.
+    Only when the server sends no Content-Length is the GET made
+    conditional (If-None-Match from the ``.etag`` sidecar). New downloads
+    go to a temporary file that is moved into place only once complete, so
+    an aborted run never leaves a truncated workbook behind.
     
     Args:
         output_path: Where to save the downloaded file
@@ -390,39 +516,89 @@ def download_cdr_report(output_path: str) -> bool:
     Returns:
         bool: True if download successful or file already exists
     """
-    if os.path.exists(output_path):
-        logger.info(f"CDR report already exists at {output_path}")
-        return True
-    
     cdr_url = "https://www.ercot.com/files/docs/2025/05/16/CapacityDemandandReservesReport_May2025_Revised.xlsx"
+    etag_path = f"{output_path}.etag"
+    
+    # Create HTTP session with retry strategy
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    # The xlsx is already zip-compressed; don't pay for gzip on top
+    session.headers['Accept-Encoding'] = 'identity'
+    
+    request_headers = {}
+    if os.path.exists(output_path):
+        try:
+            head = session.head(cdr_url, timeout=10, allow_redirects=True)
+            head.raise_for_status()
+            content_length = head.headers.get('Content-Length')
+            remote_size = int(content_length) if content_length is not None else None
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Could not revalidate CDR report ({e}); using local copy")
+            return True
+        
+        if remote_size == os.path.getsize(output_path):
+            logger.info(f"CDR report already exists at {output_path}")
+            return True
+        
+        # A size mismatch already proves the local copy is stale or damaged,
+        # so the sidecar ETag is trusted only when there is no size to compare
+        if remote_size is None and os.path.exists(etag_path):
+            with open(etag_path) as f:
+                request_headers['If-None-Match'] = f.read().strip()
     
     logger.info(f"Downloading ERCOT CDR report from {cdr_url}")
     
+    temp_path = None
     try:
-        # Create HTTP session with retry strategy
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        response = session.get(cdr_url, timeout=60)
-        response.raise_for_status()
-        
         # Ensure output directory exists
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
-        
-        logger.info(f"✅ Successfully downloaded CDR report ({len(response.content):,} bytes)")
+        output_dir = os.path.dirname(output_path) or '.'
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Stream to disk in 1 MiB chunks instead of buffering the whole workbook
+        with session.get(cdr_url, headers=request_headers, timeout=60, stream=True) as response:
+            if response.status_code == 304:
+                logger.info(f"CDR report unchanged (ETag match); keeping {output_path}")
+                return True
+            response.raise_for_status()
+            
+            with tempfile.NamedTemporaryFile(
+                mode='wb',
+                suffix='.xlsx',
+                dir=output_dir,
+                delete=False
+            ) as tmp_file:
+                temp_path = tmp_file.name
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    tmp_file.write(chunk)
+                size = tmp_file.tell()
+            
+            etag = response.headers.get('ETag')
+        
+        os.replace(temp_path, output_path)
+        if etag:
+            with open(etag_path, 'w') as f:
+                f.write(etag)
+        elif os.path.exists(etag_path):
+            # A stale sidecar would describe a file we no longer have
+            os.unlink(etag_path)
+        
+        logger.info(f"✅ Successfully downloaded CDR report ({size:,} bytes)")
         return True
         
     except Exception as e:
+        if temp_path and os.path.exists(temp_path):
+            os.unlink(temp_path)
+        if os.path.exists(output_path):
+            logger.warning(f"Failed to refresh CDR report ({e}); using local copy")
+            return True
         logger.error(f"Failed to download CDR report: {e}")
         return False
 
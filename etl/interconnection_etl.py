@@ -11,9 +11,13 @@ URL: https://www.interconnection.fyi/?market=ERCOT
 from datetime import datetime
 from pathlib import Path
 import pandas as pd
+import pyarrow.parquet as pq
 
 # Constants
 DATA_DIR = Path(__file__).parent.parent / "data"
+REQUIRED_COLUMNS = {'project_name', 'lat', 'lon', 'proposed_mw', 'fuel', 'status', 'last_updated'}
+# ercot_queue_etl.py writes these names; the app maps them onto the canonical ones
+COLUMN_ALIASES = {'capacity_mw': 'proposed_mw', 'fuel_type': 'fuel'}
 
 
 def create_empty_schema() -> pd.DataFrame:
@@ -43,6 +47,16 @@ def create_empty_schema() -> pd.DataFrame:
 
 def main():
     """Generate empty schema file."""
+    output_path = DATA_DIR / "queue.parquet"
+    
+    # Never clobber real queue data (e.g. from ercot_queue_etl.py); the
+    # footer schema is enough to tell, no row data is read
+    if output_path.exists():
+        existing = {COLUMN_ALIASES.get(name, name) for name in pq.read_schema(output_path).names}
+        if REQUIRED_COLUMNS.issubset(existing):
+            print(f"✓ {output_path} already present with valid schema; skipping")
+            return
+    
     print("Creating empty queue.parquet schema file...")
     
     # Create empty schema
@@ -52,7 +66,6 @@ def main():
     DATA_DIR.mkdir(exist_ok=True, parents=True)
     
     # Write empty parquet with schema
-    output_path = DATA_DIR / "queue.parquet"
     df.to_parquet(
         output_path,
         engine='pyarrow',
@@ -25,6 +25,8 @@ Author: Texas Association of Business Energy Dashboard
 Created: November 2025
 """
 
+import hashlib
+import json
 import logging
 import os
 import sys
@@ -32,10 +34,17 @@ from datetime import datetime, UTC
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import tempfile
-import shutil
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# Shared Texas geography helpers live next to this script
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import texas_counties
+from texas_counties import validate_coordinates_vec
 
 # Configure logging
 logging.basicConfig(
@@ -71,6 +80,50 @@ TEXAS_BOUNDS = {
     'lon_max': -93.51
 }
 
+# Development statuses in display order, and their marker colors
+DEVELOPMENT_STATUSES = ['Major', 'Early', 'Exploratory', 'Discovery']
+STATUS_NORMALIZATION = {status.lower(): status for status in DEVELOPMENT_STATUSES}
+
+# Professional color palette matching TAB brand (RGBA rows, one per status)
+# Using softer, more refined colors for better visual hierarchy
+STATUS_PALETTE = np.array([
+    [200, 16, 46, 220],   # Major: TAB Red (strong but not overpowering)
+    [255, 140, 0, 200],   # Early: Warm Orange
+    [241, 196, 15, 180],  # Exploratory: Soft Gold (less harsh than pure yellow)
+    [27, 54, 93, 160],    # Discovery: TAB Navy (instead of gray, more cohesive)
+], dtype=np.int64)
+
+# Parquet encodings: dictionary-encode the low-cardinality text columns
+DICTIONARY_COLUMNS = [
+    'deposit_name', 'minerals', 'development_status', 'county',
+    'data_source', 'last_updated'
+]
+
+# Deposit columns shared by the CSV and GeoJSON sources
+DEPOSIT_COLUMNS = [
+    'deposit_name', 'lat', 'lon', 'minerals', 'estimated_tonnage',
+    'development_status', 'county', 'details'
+]
+GEOJSON_PROPERTY_COLUMNS = [
+    'minerals', 'estimated_tonnage', 'development_status', 'county', 'details'
+]
+
+# Typed columns for the manual deposits CSV; estimated_tonnage is read as
+# text because it mixes numbers with 'TBD'/'Unknown' placeholders, which
+# per-block type inference could disagree on
+CSV_BLOCK_SIZE = 1 << 20  # bytes per streamed record batch
+CSV_CHUNK_ROWS = 50_000   # rows per chunk in the pandas fallback
+CSV_COLUMN_TYPES = {
+    'deposit_name': pa.string(),
+    'lat': pa.float64(),
+    'lon': pa.float64(),
+    'minerals': pa.string(),
+    'estimated_tonnage': pa.string(),
+    'development_status': pa.string(),
+    'county': pa.string(),
+    'details': pa.string(),
+}
+
 
 def validate_texas_coordinates(lat: float, lon: float) -> bool:
     """
@@ -89,6 +142,36 @@ def validate_texas_coordinates(lat: float, lon: float) -> bool:
     )
 
 
+def _texas_mask(df: pd.DataFrame) -> np.ndarray:
+    """
+    Vectorized validate_texas_coordinates over the lat/lon columns.
+    
+    Args:
+        df: DataFrame with numeric lat/lon columns
+        
+    Returns:
+        Boolean array, True where the row falls within Texas
+    """
+    return validate_coordinates_vec(
+        df['lat'].to_numpy(), df['lon'].to_numpy(), bounds=TEXAS_BOUNDS
+    )
+
+
+def _filter_texas_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """
+    Coerce a CSV chunk's coordinates and keep only rows inside Texas.
+    
+    Args:
+        chunk: Raw rows from the manual deposits CSV
+        
+    Returns:
+        Rows with valid coordinates within Texas boundaries
+    """
+    chunk['lat'] = pd.to_numeric(chunk['lat'], errors='coerce')
+    chunk['lon'] = pd.to_numeric(chunk['lon'], errors='coerce')
+    return chunk.loc[_texas_mask(chunk)]
+
+
 def load_manual_deposits(csv_path: str) -> pd.DataFrame:
     """
     Load manually curated mineral deposit data from CSV.
@@ -107,7 +190,9 @@ def load_manual_deposits(csv_path: str) -> pd.DataFrame:
         csv_path: Path to manual deposits CSV file
         
     Returns:
-        DataFrame with mineral deposit data
+        DataFrame with the deposits that fall within Texas; rows with
+        missing, malformed or out-of-state coordinates are dropped
+        while reading
         
     Raises:
         ETLProcessingError: If file cannot be loaded or parsed
@@ -118,14 +203,35 @@ def load_manual_deposits(csv_path: str) -> pd.DataFrame:
         logger.warning(f"⚠️  Manual deposits CSV not found at {csv_path}")
         logger.info("   Using polygon data only (CSV is optional)")
         logger.info("   To add manual deposits, create: data/manual_mineral_deposits.csv")
-        return pd.DataFrame(columns=[
-            'deposit_name', 'lat', 'lon', 'minerals', 'estimated_tonnage',
-            'development_status', 'county', 'details'
-        ])
+        return pd.DataFrame(columns=DEPOSIT_COLUMNS)
     
     try:
-        df = pd.read_csv(csv_path)
-        logger.info(f"Loaded {len(df)} manual deposits from CSV")
+        try:
+            # Stream record batches through the C++ tokenizer with the
+            # coordinates typed up front, keeping only Texas rows per batch
+            reader = pacsv.open_csv(
+                csv_path,
+                read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+                convert_options=pacsv.ConvertOptions(
+                    column_types=CSV_COLUMN_TYPES,
+                    strings_can_be_null=True
+                )
+            )
+            chunks = [_filter_texas_chunk(batch.to_pandas()) for batch in reader]
+        except pa.ArrowInvalid as e:
+            # Malformed numbers (e.g. a non-numeric lat) are coerced and
+            # dropped, so retry with pandas' lenient parser
+            logger.warning(f"Typed CSV parse failed ({e}); falling back to pandas")
+            chunks = [
+                _filter_texas_chunk(chunk)
+                for chunk in pd.read_csv(csv_path, chunksize=CSV_CHUNK_ROWS)
+            ]
+        
+        if not chunks:
+            return pd.DataFrame(columns=DEPOSIT_COLUMNS)
+        
+        df = pd.concat(chunks, ignore_index=True)
+        logger.info(f"Loaded {len(df)} manual deposits within Texas from CSV")
         return df
         
     except Exception as e:
@@ -133,31 +239,117 @@ def load_manual_deposits(csv_path: str) -> pd.DataFrame:
         raise ETLProcessingError(f"CSV load failed: {e}")
 
 
+def compute_input_hash(*input_paths: str) -> Optional[str]:
+    """
+    Fingerprint the deposit input files together with the ETL code.
+    
+    Hashing this script and the modules that shape its output
+    (texas_counties, for the bounds filter) means a code change
+    invalidates outputs produced from the same inputs. Each input path is
+    hashed along with its content, so an optional input appearing or
+    disappearing also changes the digest.
+    
+    Args:
+        *input_paths: Paths of every deposit input file the ETL reads
+        
+    Returns:
+        Hex digest, or None if none of the inputs exist
+    """
+    if not any(os.path.exists(path) for path in input_paths):
+        return None
+    
+    digest = hashlib.blake2b(digest_size=16)
+    for path in input_paths:
+        digest.update(path.encode())
+        if os.path.exists(path):
+            digest.update(Path(path).read_bytes())
+        else:
+            digest.update(b'\0missing')
+    for module_path in (__file__, texas_counties.__file__):
+        digest.update(Path(module_path).read_bytes())
+    return digest.hexdigest()
+
+
+def output_is_current(output_path: str, input_hash: Optional[str]) -> bool:
+    """
+    Check whether an existing parquet output was built from the same input.
+    
+    Args:
+        output_path: Output parquet path
+        input_hash: Hash from compute_input_hash
+        
+    Returns:
+        bool: True if the output footer carries the same input_hash
+    """
+    if input_hash is None or not os.path.exists(output_path):
+        return False
+    
+    try:
+        metadata = pq.read_metadata(output_path).metadata or {}
+    except Exception as e:
+        logger.warning(f"Could not read metadata from {output_path}: {e}")
+        return False
+    
+    return metadata.get(b'input_hash') == input_hash.encode()
+
+
 def load_geojson_deposits(geojson_path: str) -> pd.DataFrame:
     """
     Load mineral deposit data from GeoJSON file.
     
-    TODO: Implement GeoJSON loading when source data is available.
-    This function should:
-    1. Read GeoJSON using geopandas or json library
-    2. Extract geometry coordinates (Point features)
-    3. Parse properties for mineral types, tonnage estimates
-    4. Convert to pandas DataFrame with standardized columns
+    Only Point features are used; their properties are expected to carry
+    the same fields as the manual CSV (deposit_name or name, minerals,
+    estimated_tonnage, development_status, county, details). Columns are
+    collected in one pass over the features, so no per-feature geometry
+    objects or row dicts are built.
     
     Args:
         geojson_path: Path to GeoJSON file
         
     Returns:
         DataFrame with mineral deposit data
+        
+    Raises:
+        ETLProcessingError: If file cannot be loaded or parsed
     """
-    logger.info(f"GeoJSON loading not yet implemented for {geojson_path}")
-    logger.info("Using manual CSV data only")
+    logger.info(f"Loading GeoJSON deposit data from {geojson_path}")
     
-    # Placeholder - return empty DataFrame for now
-    return pd.DataFrame(columns=[
-        'deposit_name', 'lat', 'lon', 'minerals', 'estimated_tonnage',
-        'development_status', 'county', 'details'
-    ])
+    if not os.path.exists(geojson_path):
+        logger.info(f"GeoJSON deposits not found at {geojson_path}, skipping")
+        return pd.DataFrame(columns=DEPOSIT_COLUMNS)
+    
+    try:
+        with open(geojson_path, 'rb') as f:
+            features = json.load(f).get('features', [])
+        
+        columns = {col: [] for col in DEPOSIT_COLUMNS}
+        skipped = 0
+        for feature in features:
+            geometry = feature.get('geometry') or {}
+            if geometry.get('type') != 'Point':
+                skipped += 1
+                continue
+            props = feature.get('properties') or {}
+            lon, lat = geometry['coordinates'][:2]
+            columns['lat'].append(lat)
+            columns['lon'].append(lon)
+            columns['deposit_name'].append(props.get('deposit_name', props.get('name')))
+            for col in GEOJSON_PROPERTY_COLUMNS:
+                columns[col].append(props.get(col))
+        
+        if skipped:
+            logger.warning(f"Skipped {skipped} non-Point GeoJSON features")
+        
+        df = pd.DataFrame(columns)
+        df['lat'] = pd.to_numeric(df['lat'], errors='coerce')
+        df['lon'] = pd.to_numeric(df['lon'], errors='coerce')
+        
+        logger.info(f"Loaded {len(df)} deposits from GeoJSON")
+        return df
+        
+    except Exception as e:
+        logger.error(f"Failed to load GeoJSON deposits: {e}")
+        raise ETLProcessingError(f"GeoJSON load failed: {e}")
 
 
 def clean_and_validate_deposits(df: pd.DataFrame) -> pd.DataFrame:
@@ -198,21 +390,21 @@ def clean_and_validate_deposits(df: pd.DataFrame) -> pd.DataFrame:
         logger.info(f"Dropped {original_count - len(df)} deposits with invalid coordinates")
     
     # Filter to Texas boundaries
-    texas_mask = df.apply(
-        lambda row: validate_texas_coordinates(row['lat'], row['lon']), 
-        axis=1
-    )
-    df = df[texas_mask].copy()
+    df = df.loc[_texas_mask(df)].reset_index(drop=True)
     logger.info(f"Kept {len(df)} deposits within Texas boundaries")
     
-    # Standardize development_status
-    valid_statuses = ['Major', 'Early', 'Exploratory', 'Discovery']
+    # Standardize development_status: one case-insensitive lookup per
+    # distinct label, anything unrecognized becomes Exploratory
     if 'development_status' in df.columns:
-        df['development_status'] = df['development_status'].str.title()
-        invalid_status = ~df['development_status'].isin(valid_statuses)
+        status = df['development_status'].astype('category').map(
+            lambda value: STATUS_NORMALIZATION.get(str(value).lower())
+        )
+        invalid_status = status.isna()
         if invalid_status.any():
             logger.warning(f"Found {invalid_status.sum()} deposits with invalid status")
-            df.loc[invalid_status, 'development_status'] = 'Exploratory'
+        df['development_status'] = pd.Categorical(
+            status.fillna('Exploratory'), categories=DEVELOPMENT_STATUSES
+        )
     else:
         logger.warning("No development_status column found, setting default")
         df['development_status'] = 'Exploratory'
@@ -239,8 +431,10 @@ def clean_and_validate_deposits(df: pd.DataFrame) -> pd.DataFrame:
     if 'details' not in df.columns:
         df['details'] = ''
     
-    # Remove duplicate deposits (same name and location)
-    df = df.drop_duplicates(subset=['deposit_name', 'lat', 'lon'])
+    # Remove duplicate deposits (same name and location), keyed on one
+    # 64-bit hash per row rather than the three columns themselves
+    key = pd.util.hash_pandas_object(df[['deposit_name', 'lat', 'lon']], index=False)
+    df = df.loc[~key.duplicated().to_numpy()].reset_index(drop=True)
     
     logger.info(f"✅ Cleaned data: {len(df)} valid deposits")
     
@@ -264,33 +458,28 @@ def add_visualization_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Adding visualization columns for dashboard")
     
-    # Professional color palette matching TAB brand
-    # Using softer, more refined colors for better visual hierarchy
-    status_colors = {
-        'Major': [200, 16, 46, 220],       # TAB Red (strong but not overpowering)
-        'Early': [255, 140, 0, 200],        # Warm Orange
-        'Exploratory': [241, 196, 15, 180], # Soft Gold (less harsh than pure yellow)
-        'Discovery': [27, 54, 93, 160]      # TAB Navy (instead of gray, more cohesive)
-    }
-    
-    df['color'] = df['development_status'].map(status_colors)
+    # Gather RGBA rows from the palette by status code; the dashboard
+    # expects one [r, g, b, a] list per deposit
+    codes = pd.Categorical(df['development_status'], categories=DEVELOPMENT_STATUSES).codes
+    colors = STATUS_PALETTE[codes].tolist()
+    for i in np.flatnonzero(codes < 0):
+        colors[i] = np.nan  # Unknown status: no color, as with a dict lookup miss
+    df['color'] = colors
     
     # Refined radius scaling: smaller, more proportional markers
     # Range: 2,500-12,000 pixels (much smaller than before for cleaner look)
-    df['radius'] = df['estimated_tonnage'].apply(
-        lambda x: 2500 + (np.log10(max(x, 1)) * 3000) if x > 0 else 2500
-    )
+    # Flooring tonnage at 1 pins zero/unknown tonnage to the 2,500 minimum
+    tonnage = df['estimated_tonnage'].to_numpy(dtype=np.float64)
+    df['radius'] = 2500.0 + np.log10(np.maximum(tonnage, 1.0)) * 3000.0
     
     # Create formatted tooltip text
-    df['tooltip'] = df.apply(
-        lambda row: (
-            f"{row['deposit_name']}\n"
-            f"Minerals: {row['minerals']}\n"
-            f"Status: {row['development_status']}\n"
-            f"Est. Tonnage: {row['estimated_tonnage']:,.0f} MT\n"
-            f"County: {row['county']}"
-        ),
-        axis=1
+    tonnage_str = df['estimated_tonnage'].map('{:,.0f}'.format)
+    df['tooltip'] = (
+        df['deposit_name'].astype(str) +
+        '\nMinerals: ' + df['minerals'].astype(str) +
+        '\nStatus: ' + df['development_status'].astype(str) +
+        '\nEst. Tonnage: ' + tonnage_str + ' MT' +
+        '\nCounty: ' + df['county'].astype(str)
     )
     
     logger.info("✅ Added color, radius, and tooltip columns")
@@ -329,24 +518,33 @@ def validate_schema(df: pd.DataFrame) -> bool:
         raise ETLValidationError("estimated_tonnage must be numeric")
     
     # Check coordinate bounds
-    invalid_coords = df.apply(
-        lambda row: not validate_texas_coordinates(row['lat'], row['lon']),
-        axis=1
-    )
-    if invalid_coords.any():
-        raise ETLValidationError(f"Found {invalid_coords.sum()} deposits outside Texas")
+    # The cleaner already filtered to Texas, so a min/max range check is
+    # enough; written so NaN coordinates also fail. Count only on failure
+    lat = df['lat'].to_numpy()
+    lon = df['lon'].to_numpy()
+    if len(df) and not (
+        TEXAS_BOUNDS['lat_min'] <= lat.min() and lat.max() <= TEXAS_BOUNDS['lat_max'] and
+        TEXAS_BOUNDS['lon_min'] <= lon.min() and lon.max() <= TEXAS_BOUNDS['lon_max']
+    ):
+        invalid_count = int((~_texas_mask(df)).sum())
+        raise ETLValidationError(f"Found {invalid_count} deposits outside Texas")
     
     logger.info(f"✅ Schema validation passed for {len(df)} deposits")
     return True
 
 
-def atomic_write_parquet(df: pd.DataFrame, output_path: str) -> None:
+def atomic_write_parquet(
+    df: pd.DataFrame,
+    output_path: str,
+    input_hash: Optional[str] = None
+) -> None:
     """
     Write DataFrame to parquet file atomically.
     
     Args:
         df: DataFrame to write
         output_path: Output file path
+        input_hash: Optional input fingerprint stored in the footer metadata
         
     Raises:
         ETLProcessingError: If write fails
@@ -365,16 +563,30 @@ def atomic_write_parquet(df: pd.DataFrame, output_path: str) -> None:
         ) as tmp_file:
             temp_path = tmp_file.name
         
-        df.to_parquet(temp_path, index=False, engine='pyarrow')
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if input_hash is not None:
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                b'input_hash': input_hash.encode()
+            })
         
-        # Verify write
-        test_df = pd.read_parquet(temp_path)
-        if len(test_df) != len(df):
+        pq.write_table(
+            table,
+            temp_path,
+            compression='zstd',
+            compression_level=3,
+            use_dictionary=[col for col in DICTIONARY_COLUMNS if col in df.columns],
+            row_group_size=4096,
+        )
+        
+        # Verify write from the footer alone; no column data is decoded
+        written_rows = pq.read_metadata(temp_path).num_rows
+        if written_rows != len(df):
             raise ETLProcessingError(
-                f"Verification failed: expected {len(df)} rows, got {len(test_df)}"
+                f"Verification failed: expected {len(df)} rows, got {written_rows}"
             )
         
-        shutil.move(temp_path, output_path)
+        os.replace(temp_path, output_path)
         logger.info(f"✅ Successfully wrote mineral data to {output_path}")
         
     except Exception as e:
@@ -384,6 +596,29 @@ def atomic_write_parquet(df: pd.DataFrame, output_path: str) -> None:
         raise ETLProcessingError(f"File write failed: {e}")
 
 
+def generate_polygon_overlays() -> None:
+    """
+    Regenerate formation polygon overlays from the USGS shapefile.
+    
+    Independent of the deposit point data, so it runs even when the
+    deposits parquet is already current. Failures are logged, not raised.
+    """
+    logger.info("")
+    logger.info("🗺️  Generating formation polygon overlays...")
+    try:
+        import convert_shapefile
+        # Check for the input before running the converter at all
+        if convert_shapefile.find_shapefile() is None:
+            logger.info("   Shapefile not found, skipping polygon overlays")
+        elif convert_shapefile.main():
+            logger.info("✅ Polygon overlay generation successful")
+        else:
+            logger.warning("⚠️  Polygon generation failed, see converter log")
+    except Exception as e:
+        logger.warning(f"⚠️  Polygon generation failed: {e}")
+        logger.info("   Continuing with point data only...")
+
+
 def main():
     """Main ETL execution function"""
     logger.info("=" * 60)
@@ -396,6 +631,17 @@ def main():
         geojson_path = "data/mineral_deposits.geojson"  # TODO: Add when available
         output_path = "data/minerals_deposits.parquet"
         
+        # Point data needs no rebuild if the output was built from these
+        # exact inputs; the polygon overlays are still regenerated
+        input_hash = compute_input_hash(manual_csv_path, geojson_path)
+        if output_is_current(output_path, input_hash):
+            logger.info(f"✅ Input unchanged since last run, keeping {output_path}")
+            generate_polygon_overlays()
+            return True
+        
+        # One timestamp for the whole run, reused for the column and the log
+        now_str = datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')
+        
         # Load data from available sources
         logger.info("📥 Loading mineral deposit data...")
         
@@ -425,7 +671,7 @@ def main():
                 'radius': [2500],
                 'tooltip': ['Polygon Data Only\nMinerals: See polygon formations on map\nStatus: Discovery\nEst. Tonnage: 0 MT\nCounty: Multiple'],
                 'data_source': ['Polygon Only'],
-                'last_updated': [datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')]
+                'last_updated': [now_str]
             })
             atomic_write_parquet(empty_df, output_path)
             logger.info("✅ Created placeholder mineral data (polygon formations still available)")
@@ -443,9 +689,14 @@ def main():
             logger.info("🎨 Adding visualization attributes...")
             final_df = add_visualization_columns(clean_df)
         
-            # Add metadata
-            final_df['data_source'] = 'Manual CSV + GeoJSON'
-            final_df['last_updated'] = datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')
+            # Add metadata as single-category columns: one dictionary
+            # entry each on disk instead of N repeated strings
+            final_df['data_source'] = pd.Categorical.from_codes(
+                np.zeros(len(final_df), dtype=np.int8), categories=['Manual CSV + GeoJSON']
+            )
+            final_df['last_updated'] = pd.Categorical.from_codes(
+                np.zeros(len(final_df), dtype=np.int8), categories=[now_str]
+            )
         
             # Validate final schema
             logger.info("✅ Validating final schema...")
@@ -453,21 +704,10 @@ def main():
         
             # Write output
             logger.info("💾 Writing mineral data...")
-            atomic_write_parquet(final_df, output_path)
+            atomic_write_parquet(final_df, output_path, input_hash=input_hash)
         
         # Generate polygon overlays from USGS shapefile
-        logger.info("")
-        logger.info("🗺️  Generating formation polygon overlays...")
-        try:
-            import convert_shapefile
-            polygon_success = convert_shapefile.main()
-            if polygon_success:
-                logger.info("✅ Polygon overlay generation successful")
-            else:
-                logger.warning("⚠️  Polygon generation skipped (shapefile not found)")
-        except Exception as e:
-            logger.warning(f"⚠️  Polygon generation failed: {e}")
-            logger.info("   Continuing with point data only...")
+        generate_polygon_overlays()
         
         # Summary statistics
         logger.info("=" * 60)
@@ -478,7 +718,7 @@ def main():
         logger.info(f"⚡ Total estimated tonnage: {final_df['estimated_tonnage'].sum():,.0f} MT")
         logger.info(f"🗺️  Geographic coverage: {final_df['county'].nunique()} counties")
         logger.info(f"📁 Output file: {output_path}")
-        logger.info(f"🕒 Last updated: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')}")
+        logger.info(f"🕒 Last updated: {now_str}")
         
         return True
         
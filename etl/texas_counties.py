@@ -12,14 +12,21 @@ Data sources:
 Last updated: 2024-11-05
 """
 
-from typing import Tuple
+from difflib import get_close_matches
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 import logging
+import sys
+
+import numpy as np
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 # All 254 Texas counties with approximate centroids (lat, lon)
 # Organized alphabetically for easy maintenance
-TEXAS_COUNTY_CENTROIDS = {
+_COUNTY_CENTROIDS = {
     # Major Metro Counties (high priority for ERCOT queue)
     "HARRIS": (29.7604, -95.3698),        # Houston
     "DALLAS": (32.7767, -96.7970),        # Dallas
@@ -284,14 +291,53 @@ TEXAS_COUNTY_CENTROIDS = {
     "ZAVALA": (28.8669, -99.7570),
 }
 
+# Read-only view with interned keys, so lookups with an interned name
+# short-circuit on identity and callers can't mutate the shared table
+TEXAS_COUNTY_CENTROIDS: Mapping[str, Tuple[float, float]] = MappingProxyType({
+    sys.intern(name): coords for name, coords in _COUNTY_CENTROIDS.items()
+})
+
+# Bound lookup, saving the global + attribute load on every call
+_CENTROID_LOOKUP = TEXAS_COUNTY_CENTROIDS.get
+
 # Texas state centroid for fallback
 TEXAS_CENTROID = (31.0, -99.9)
 
+# Default Texas bounds for coordinate validation
+TEXAS_BOUNDS: Mapping[str, float] = MappingProxyType({
+    'lat_min': 25.8,
+    'lat_max': 36.5,
+    'lon_min': -106.7,
+    'lon_max': -93.5
+})
+
+# Columnar copy of the table for bulk lookups: row i of _COUNTY_COORDS
+# holds the (lat, lon) of the county whose name maps to i
+_COUNTY_INDEX: Mapping[str, int] = MappingProxyType({
+    name: i for i, name in enumerate(TEXAS_COUNTY_CENTROIDS)
+})
+_COUNTY_COORDS = np.array(list(TEXAS_COUNTY_CENTROIDS.values()), dtype=np.float64)
+_COUNTY_NAMES = tuple(TEXAS_COUNTY_CENTROIDS)
+
+# Minimum difflib similarity for treating an unknown name as a misspelling
+FUZZY_MATCH_CUTOFF = 0.85
+
 
+def _closest_county_name(county_upper: str) -> Optional[str]:
+    """Best fuzzy match for a normalized county name, or None."""
+    matches = get_close_matches(county_upper, _COUNTY_NAMES, n=1, cutoff=FUZZY_MATCH_CUTOFF)
+    return matches[0] if matches else None
+
+
+@lru_cache(maxsize=512)
 def get_county_coordinates(county_name: str) -> Tuple[float, float]:
     """
     Get latitude and longitude for a Texas county.
     
+    Memoized on the raw name (Texas has 254 counties, the rest of the
+    cache covers spelling variants), so repeat lookups skip normalizing
+    entirely; call get_county_coordinates.cache_clear() to reset.
+    
     Args:
         county_name: County name in uppercase (e.g., "HARRIS", "TRAVIS")
         
@@ -302,22 +348,98 @@ def get_county_coordinates(county_name: str) -> Tuple[float, float]:
         >>> get_county_coordinates("HARRIS")
         (29.7604, -95.3698)
         
+        >>> get_county_coordinates("HARIS")
+        (29.7604, -95.3698)  # Closest name match
+        
         >>> get_county_coordinates("UNKNOWN COUNTY")
         (31.0, -99.9)  # Texas centroid fallback
     """
+    # Fast path: names from the ERCOT sheets are usually already
+    # normalized, so try them as-is before allocating a cleaned copy
+    coords = _CENTROID_LOOKUP(county_name)
+    if coords is not None:
+        return coords
+    
     county_upper = county_name.strip().upper()
+    coords = _CENTROID_LOOKUP(county_upper)
+    if coords is not None:
+        return coords
     
-    if county_upper in TEXAS_COUNTY_CENTROIDS:
-        return TEXAS_COUNTY_CENTROIDS[county_upper]
+    # Misspelled or differently formatted names: closest known county
+    match = _closest_county_name(county_upper)
+    if match is not None:
+        logger.warning(
+            "County '%s' not found in database. Using closest match '%s'.",
+            county_name, match
+        )
+        return TEXAS_COUNTY_CENTROIDS[match]
     else:
         logger.warning(
-            f"County '{county_name}' not found in database. "
-            f"Using Texas centroid {TEXAS_CENTROID}. "
-            f"Please add this county to TEXAS_COUNTY_CENTROIDS."
+            "County '%s' not found in database. Using Texas centroid %s. "
+            "Please add this county to TEXAS_COUNTY_CENTROIDS.",
+            county_name, TEXAS_CENTROID
         )
         return TEXAS_CENTROID
 
 
+def _resolve_county_index(county_name: str) -> int:
+    """Row in _COUNTY_COORDS for a name (exact, then fuzzy), or -1."""
+    county_upper = county_name.strip().upper()
+    index = _COUNTY_INDEX.get(county_upper)
+    if index is None:
+        match = _closest_county_name(county_upper)
+        if match is None:
+            return -1
+        logger.warning(
+            "County '%s' not found in database. Using closest match '%s'.",
+            county_name, match
+        )
+        index = _COUNTY_INDEX[match]
+    return index
+
+
+def get_county_coordinates_bulk(county_names: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized get_county_coordinates for a whole column of county names.
+    
+    Each distinct name is normalized and looked up once (falling back to
+    the closest spelling, as get_county_coordinates does); the coordinates
+    are then gathered from a (n_counties, 2) array in one step.
+    
+    Args:
+        county_names: County names, any case, possibly with whitespace
+        
+    Returns:
+        Tuple of (latitude, longitude) float64 arrays aligned with
+        county_names; unknown or missing counties get TEXAS_CENTROID
+    """
+    if isinstance(county_names.dtype, pd.CategoricalDtype):
+        # Already deduplicated: reuse the categories and codes as-is
+        codes = county_names.cat.codes.to_numpy()
+        unique_names = county_names.cat.categories
+    else:
+        codes, unique_names = pd.factorize(county_names)
+    unique_idx = np.array(
+        [_resolve_county_index(str(name)) for name in unique_names],
+        dtype=np.intp
+    )
+    
+    unknown = [str(name) for name, i in zip(unique_names, unique_idx) if i < 0]
+    if unknown:
+        logger.warning(
+            "%d counties not found in database: %s. Using Texas centroid %s. "
+            "Please add them to TEXAS_COUNTY_CENTROIDS.",
+            len(unknown), unknown, TEXAS_CENTROID
+        )
+    
+    # A trailing -1 makes missing names (code -1) index to "not found" too
+    row_idx = np.append(unique_idx, -1)[codes]
+    found = row_idx >= 0
+    lats = np.where(found, _COUNTY_COORDS[row_idx, 0], TEXAS_CENTROID[0])
+    lons = np.where(found, _COUNTY_COORDS[row_idx, 1], TEXAS_CENTROID[1])
+    return lats, lons
+
+
 def validate_coordinates(lat: float, lon: float) -> bool:
     """
     Validate that coordinates are within Texas bounds.
@@ -334,11 +456,46 @@ def validate_coordinates(lat: float, lon: float) -> bool:
         True if coordinates are within Texas, False otherwise
     """
     return (
-        25.8 <= lat <= 36.5 and
-        -106.7 <= lon <= -93.5
+        TEXAS_BOUNDS['lat_min'] <= lat <= TEXAS_BOUNDS['lat_max'] and
+        TEXAS_BOUNDS['lon_min'] <= lon <= TEXAS_BOUNDS['lon_max']
     )
 
 
+def validate_coordinates_vec(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    bounds: Optional[Mapping[str, float]] = None
+) -> np.ndarray:
+    """
+    Vectorized validate_coordinates over arrays of points.
+    
+    Shared by the ETL scripts so each checks its own bounds the same way.
+    
+    Args:
+        lats: Latitudes
+        lons: Longitudes
+        bounds: Optional lat_min/lat_max/lon_min/lon_max mapping;
+            defaults to TEXAS_BOUNDS
+        
+    Returns:
+        Boolean array, True where the point is within the bounds
+        (NaN coordinates are never within bounds)
+    """
+    if bounds is None:
+        bounds = TEXAS_BOUNDS
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    
+    # AND each comparison into one mask through a reused scratch buffer
+    # instead of allocating a temporary per comparison and per &
+    mask = np.greater_equal(lats, bounds['lat_min'])
+    scratch = np.empty_like(mask)
+    mask &= np.less_equal(lats, bounds['lat_max'], out=scratch)
+    mask &= np.greater_equal(lons, bounds['lon_min'], out=scratch)
+    mask &= np.less_equal(lons, bounds['lon_max'], out=scratch)
+    return mask
+
+
 # Module metadata
 __version__ = "1.0.0"
 __author__ = "TAB Energy Dashboard"
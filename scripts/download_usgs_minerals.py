@@ -7,9 +7,53 @@ Alternative sources if MRDS shapefile download fails:
 3. Pre-processed Texas mineral data from data.gov
 """
 
+import os
 import requests
 import json
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional; it parses the (large) API payload several times
+# faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Repository root, resolved once
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def create_http_session() -> requests.Session:
+    """
+    Create HTTP session with connection pooling, retries and gzip.
+    
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=frozenset({429, 500, 502, 503, 504}))
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        'User-Agent': 'TAB-Energy-Dashboard/1.0',
+        'Accept-Encoding': 'gzip, deflate',
+    })
+    return session
+
+
+# Shared across calls so repeated queries reuse the TLS connection
+_SESSION = create_http_session()
+
+def _load_json(path: Path):
+    """Parse a JSON file, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'rb') as f:
+        return json.load(f)
+
 
 def download_texas_minerals():
     """
@@ -33,21 +77,45 @@ def download_texas_minerals():
     print("🔍 Querying USGS Mineral Deposit Database for Texas...")
     print(f"   API: {api_url}")
     
+    output_path = ROOT / "data" / "temp" / "usgs_texas_minerals_raw.json"
+    temp_path = output_path.with_suffix('.json.part')
+    etag_path = output_path.with_name(f"{output_path.name}.etag")
+    
     try:
-        response = requests.get(f"{api_url}/query", params=params, timeout=30)
-        response.raise_for_status()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        data = response.json()
+        # Conditional request: unchanged data comes back as an empty 304
+        headers = {}
+        if output_path.exists() and etag_path.exists():
+            headers['If-None-Match'] = etag_path.read_text().strip()
+        
+        # Stream the response body straight to disk instead of parsing it
+        # and serializing it again
+        with _SESSION.get(
+            f"{api_url}/query", params=params, headers=headers, timeout=30, stream=True
+        ) as response:
+            if response.status_code == 304:
+                print("✅ USGS data unchanged (ETag match); using cached response")
+                return _load_json(output_path)
+            
+            response.raise_for_status()
+            with open(temp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
+            etag = response.headers.get('ETag')
+        
+        # Parse once, from disk, to check the payload and return it
+        data = _load_json(temp_path)
         
         if 'features' in data:
             print(f"✅ Found {len(data['features'])} mineral deposits in Texas")
             
-            # Save raw API response
-            output_path = Path(__file__).parent.parent / "data" / "temp" / "usgs_texas_minerals_raw.json"
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Keep the raw API response, and its ETag for the next run
+            os.replace(temp_path, output_path)
+            if etag:
+                etag_path.write_text(etag)
+            else:
+                etag_path.unlink(missing_ok=True)
             
             print(f"💾 Saved to: {output_path}")
             return data
@@ -61,6 +129,8 @@ def download_texas_minerals():
     except Exception as e:
         print(f"❌ Error: {e}")
         return None
+    finally:
+        temp_path.unlink(missing_ok=True)
 
 if __name__ == "__main__":
     download_texas_minerals()
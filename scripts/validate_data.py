@@ -11,17 +11,25 @@ Used by GitHub Actions to ensure data quality before committing.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, List, Tuple
 
 import pandas as pd
+import pyarrow.parquet as pq
+
+# Repository root, resolved once
+ROOT = Path(__file__).resolve().parent.parent
 
 # Add app directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+sys.path.insert(0, str(ROOT / "app"))
 
-from utils.schema import SCHEMAS, validate, coerce_types, normalize_columns
+from utils.schema import (
+    COLUMN_ALIASES, SCHEMAS, validate, coerce_types, normalize_columns
+)
 
 # Data directory
-DATA_DIR = Path(__file__).parent.parent / "data"
+DATA_DIR = ROOT / "data"
 
 # Files to validate
 FILES_TO_VALIDATE = {
@@ -32,68 +40,93 @@ FILES_TO_VALIDATE = {
 }
 
 
-def validate_file(filepath: Path, dataset: str) -> bool:
+def validate_file(
+    filepath: Path,
+    dataset: str,
+    log: Callable[[str], None] = print
+) -> bool:
     """
     Validate a single data file.
     
     Args:
         filepath: Path to the parquet file
         dataset: Dataset name for schema validation
+        log: Sink for report lines (print by default)
         
     Returns:
         True if valid, False otherwise
     """
-    print(f"\nValidating {filepath.name}...")
+    log(f"\nValidating {filepath.name}...")
     
     # Check file exists
     if not filepath.exists():
-        print(f"  ✗ File not found: {filepath}")
+        log(f"  ✗ File not found: {filepath}")
         return False
     
     try:
-        # Read parquet
-        df = pd.read_parquet(filepath)
-        print(f"  ✓ File readable: {len(df)} rows, {len(df.columns)} columns")
-        
-        # Normalize and coerce
-        df = normalize_columns(df, dataset)
-        df = coerce_types(df, dataset)
+        # Row count and column names come from the footer; nothing is
+        # decoded until the null check below
+        parquet_file = pq.ParquetFile(filepath)
+        num_rows = parquet_file.metadata.num_rows
+        schema = parquet_file.schema_arrow
+        # Stored pandas index columns aren't data columns (read_parquet
+        # would restore them as the index)
+        index_cols = {
+            col for col in (schema.pandas_metadata or {}).get('index_columns', [])
+            if isinstance(col, str)
+        }
+        source_cols = [col for col in schema.names if col not in index_cols]
+        log(f"  ✓ File readable: {num_rows} rows, {len(source_cols)} columns")
         
-        # Validate schema
-        missing, extra = validate(df, dataset)
+        # Map file columns to canonical names and validate schema
+        aliases = COLUMN_ALIASES.get(dataset, {})
+        canonical_to_source = {aliases.get(col, col): col for col in source_cols}
+        missing, extra = validate(pd.DataFrame(columns=list(canonical_to_source)), dataset)
         
         if missing:
-            print(f"  ✗ Missing required columns: {missing}")
+            log(f"  ✗ Missing required columns: {missing}")
             return False
         
-        print(f"  ✓ Schema valid")
+        log(f"  ✓ Schema valid")
         
         if extra:
-            print(f"  ℹ Extra columns (ok): {extra}")
+            log(f"  ℹ Extra columns (ok): {extra}")
         
         # Check for empty files (allow generation and queue to be empty stubs)
-        if len(df) == 0:
+        if num_rows == 0:
             if dataset in ["generation", "queue"]:
-                print(f"  ℹ File is empty (stub - ok)")
+                # Nothing to null-check; skip reading any column data
+                log(f"  ℹ File is empty (stub - ok)")
+                log(f"  ✓ {filepath.name} validation passed")
+                return True
             else:
-                print(f"  ✗ File is empty")
+                log(f"  ✗ File is empty")
                 return False
         else:
-            print(f"  ✓ Contains {len(df)} records")
+            log(f"  ✓ Contains {num_rows} records")
+        
+        # Check for null values in required columns (one pass over all of
+        # them), reading and coercing only those columns
+        expected = SCHEMAS[dataset]
+        source_required = [canonical_to_source[col] for col in expected]
+        df = parquet_file.read(columns=source_required).to_pandas()
         
-        # Check for null values in required columns
-        required_cols = set(SCHEMAS[dataset].keys())
-        for col in required_cols:
-            if col in df.columns:
-                null_count = df[col].isnull().sum()
-                if null_count > 0:
-                    print(f"  ⚠ Column '{col}' has {null_count} null values")
+        # Files written by our own ETL are usually canonical already; only
+        # rename/cast when something actually differs
+        if source_required != list(expected):
+            df = normalize_columns(df, dataset)
+        if any(str(df[col].dtype) != dtype for col, dtype in expected.items()):
+            df = coerce_types(df, dataset)
         
-        print(f"  ✓ {filepath.name} validation passed")
+        null_counts = df[list(expected)].isnull().sum()
+        for col, null_count in null_counts[null_counts > 0].items():
+            log(f"  ⚠ Column '{col}' has {null_count} null values")
+        
+        log(f"  ✓ {filepath.name} validation passed")
         return True
         
     except Exception as e:
-        print(f"  ✗ Validation error: {str(e)}")
+        log(f"  ✗ Validation error: {str(e)}")
         return False
 
 
@@ -103,12 +136,19 @@ def main():
     print("Data Validation")
     print("="*60)
     
-    all_valid = True
+    def run(item: Tuple[str, str]) -> Tuple[bool, List[str]]:
+        filename, dataset = item
+        lines: List[str] = []
+        return validate_file(DATA_DIR / filename, dataset, log=lines.append), lines
+    
+    # Validate files concurrently (parquet reads release the GIL) and
+    # print each file's report in order once it is done
+    with ThreadPoolExecutor(max_workers=len(FILES_TO_VALIDATE)) as executor:
+        results = list(executor.map(run, FILES_TO_VALIDATE.items()))
     
-    for filename, dataset in FILES_TO_VALIDATE.items():
-        filepath = DATA_DIR / filename
-        if not validate_file(filepath, dataset):
-            all_valid = False
+    for _, lines in results:
+        print("\n".join(lines))
+    all_valid = all(valid for valid, _ in results)
     
     print("\n" + "="*60)
     if all_valid:
@@ -0,0 +1,102 @@
+"""
+Unit tests for the Texas county centroid lookups
+
+Tests exact, misspelled and unknown county names through both the
+scalar and the bulk (vectorized) geocoding paths.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(str(Path(__file__).parent))
+
+from etl.texas_counties import (
+    get_county_coordinates,
+    get_county_coordinates_bulk,
+    validate_coordinates_vec,
+    TEXAS_CENTROID,
+    TEXAS_COUNTY_CENTROIDS,
+)
+
+
+class TestCountyLookup:
+    """Test scalar county coordinate lookups."""
+
+    def test_exact_name(self):
+        """Test that a known county returns its centroid."""
+        assert get_county_coordinates("HARRIS") == TEXAS_COUNTY_CENTROIDS["HARRIS"]
+
+    def test_case_and_whitespace_normalized(self):
+        """Test that names are matched after stripping and uppercasing."""
+        assert get_county_coordinates("  travis ") == TEXAS_COUNTY_CENTROIDS["TRAVIS"]
+
+    def test_near_miss_uses_closest_county(self):
+        """Test that a misspelled county falls back to the closest name."""
+        assert get_county_coordinates("HARIS") == TEXAS_COUNTY_CENTROIDS["HARRIS"]
+
+    def test_unknown_name_uses_texas_centroid(self):
+        """Test that an unrecognizable name falls back to the state centroid."""
+        assert get_county_coordinates("UNKNOWN COUNTY") == TEXAS_CENTROID
+
+
+class TestBulkLookup:
+    """Test vectorized county coordinate lookups."""
+
+    NAMES = ['HARRIS', 'haris', 'Nowhere Special', None, 'TRAVIS', 'HARRIS']
+
+    def expected(self):
+        """Coordinates the scalar path gives for NAMES (None -> centroid)."""
+        coords = [
+            get_county_coordinates(name) if name is not None else TEXAS_CENTROID
+            for name in self.NAMES
+        ]
+        return np.array([c[0] for c in coords]), np.array([c[1] for c in coords])
+
+    def test_bulk_matches_scalar_lookup(self):
+        """Test that bulk lookup agrees with the scalar path row by row."""
+        lats, lons = get_county_coordinates_bulk(pd.Series(self.NAMES))
+        expected_lats, expected_lons = self.expected()
+
+        np.testing.assert_array_equal(lats, expected_lats)
+        np.testing.assert_array_equal(lons, expected_lons)
+        assert (lats[1], lons[1]) == TEXAS_COUNTY_CENTROIDS["HARRIS"]
+        assert (lats[2], lons[2]) == TEXAS_CENTROID
+        assert (lats[3], lons[3]) == TEXAS_CENTROID
+
+    def test_bulk_categorical_input(self):
+        """Test that categorical input gives the same result as strings."""
+        lats, lons = get_county_coordinates_bulk(pd.Series(self.NAMES, dtype='category'))
+        expected_lats, expected_lons = self.expected()
+
+        np.testing.assert_array_equal(lats, expected_lats)
+        np.testing.assert_array_equal(lons, expected_lons)
+
+
+class TestCoordinateValidation:
+    """Test the shared vectorized bounds check."""
+
+    def test_default_bounds(self):
+        """Test points inside, outside and missing against Texas bounds."""
+        lats = np.array([30.0, 40.0, np.nan, 31.0])
+        lons = np.array([-97.0, -97.0, -97.0, -110.0])
+
+        result = validate_coordinates_vec(lats, lons)
+
+        np.testing.assert_array_equal(result, [True, False, False, False])
+
+    def test_custom_bounds(self):
+        """Test that caller-supplied bounds replace the defaults."""
+        bounds = {'lat_min': 25.84, 'lat_max': 36.50, 'lon_min': -106.65, 'lon_max': -93.51}
+
+        result = validate_coordinates_vec([25.82, 30.0], [-97.0, -97.0], bounds=bounds)
+
+        np.testing.assert_array_equal(result, [False, True])
+
+
+if __name__ == "__main__":
+    # Run tests when script is executed directly
+    pytest.main([__file__, "-v"])